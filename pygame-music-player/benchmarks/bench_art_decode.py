@@ -0,0 +1,75 @@
+"""
+Album art decode benchmark.
+Compares full-resolution decoding of embedded artwork with the reduced
+(JPEG draft / reduce) path used by Cover Flow, per cover.
+
+Usage: python benchmarks/bench_art_decode.py [image_or_mp3 ...]
+Without arguments a synthetic 1500x1500 JPEG is used.
+"""
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from PIL import Image
+from cover_flow import open_art_image
+
+THUMBNAIL_SIZE = (120, 120)  # Largest size the UI needs
+ITERATIONS = 20
+
+
+def synthetic_jpeg(size=1500):
+    img = Image.new("RGB", (size, size), (40, 90, 160))
+    for x in range(0, size, 60):
+        img.paste((220, 180, 40), (x, 0, x + 30, size))
+    buffer = io.BytesIO()
+    img.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def load_samples(paths):
+    samples = []
+    for path in paths:
+        if path.lower().endswith(".mp3"):
+            from mutagen.id3 import ID3
+            for tag in ID3(path).getall("APIC"):
+                samples.append((path, tag.data))
+                break
+        else:
+            samples.append((path, Path(path).read_bytes()))
+    return samples
+
+
+def decode_full(data):
+    img = Image.open(io.BytesIO(data)).convert("RGBA")
+    return img.resize(THUMBNAIL_SIZE, Image.LANCZOS).tobytes()
+
+
+def decode_reduced(data):
+    img = open_art_image(data, THUMBNAIL_SIZE)
+    return img.resize(THUMBNAIL_SIZE, Image.LANCZOS).tobytes()
+
+
+def time_per_cover(fn, data):
+    fn(data)  # Warm up
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(data)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def main():
+    samples = load_samples(sys.argv[1:]) or [("synthetic 1500px JPEG", synthetic_jpeg())]
+    for name, data in samples:
+        full_ms = time_per_cover(decode_full, data)
+        reduced_ms = time_per_cover(decode_reduced, data)
+        print(f"{name}: full {full_ms:.2f} ms, reduced {reduced_ms:.2f} ms, "
+              f"speedup x{full_ms / max(reduced_ms, 1e-6):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Display backend benchmark.
+Presents the same frames (a list screen that changes every frame and a
+Click Wheel that only changes now and then) with the software backend
+(blits + display.flip) and the SDL2 Renderer/Texture backend, on the
+same machine.
+
+Usage: python benchmarks/bench_display_backend.py [frames] [render_driver]
+render_driver is passed as SDL_RENDER_DRIVER (e.g. "software", "opengl")
+to compare against SDL's own software renderer. Without a display, set
+SDL_VIDEODRIVER=dummy.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+FRAMES = 600
+WHEEL_CHANGE_EVERY = 30  # Frames between Click Wheel redraws (a button press)
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    if len(sys.argv) > 2:
+        os.environ["SDL_RENDER_DRIVER"] = sys.argv[2]
+
+    import pygame
+    from ui_config import UIConfig
+    from renderer import iPodRenderer
+    from click_wheel import ClickWheel
+    from display_backend import SoftwareDisplay, SDL2Display
+
+    pygame.init()
+    config = UIConfig()
+    width, display_height, window_height = 358, 269, 431
+    display_surface = pygame.Surface((width, display_height))
+    wheel_surface = pygame.Surface((width, window_height - display_height), pygame.SRCALPHA)
+    renderer = iPodRenderer(display_surface, config)
+    click_wheel = ClickWheel(config)
+    items = [{"label": f"Song {i}", "action": "play"} for i in range(200)]
+
+    backends = [("software", lambda: SoftwareDisplay((width, window_height), "bench"))]
+    backends.append(("sdl2", lambda: SDL2Display((width, window_height), "bench")))
+    for name, factory in backends:
+        try:
+            display = factory()
+        except Exception as e:
+            print(f"{name}: not available ({e})")
+            continue
+        draw_ms = present_ms = 0.0
+        for frame in range(frames):
+            start = time.perf_counter()
+            display_surface.fill(config.BG_COLOR)
+            renderer.draw_menu(items, frame % len(items), max(0, frame % len(items) - 7))
+            wheel_changed = frame % WHEEL_CHANGE_EVERY == 0
+            if wheel_changed:
+                click_wheel.center_button_pressed = not click_wheel.center_button_pressed
+                wheel_surface.fill((0, 0, 0, 0))
+                click_wheel.draw(wheel_surface)
+            middle = time.perf_counter()
+            display.present(display_surface, wheel_surface, display_height, wheel_changed)
+            end = time.perf_counter()
+            draw_ms += (middle - start) * 1000
+            present_ms += (end - middle) * 1000
+        print(f"{name}: draw {draw_ms / frames:.3f} ms/frame, present {present_ms / frames:.3f} ms/frame, "
+              f"texture uploads {display.uploads}")
+        if name == "sdl2":
+            print(f"  render driver: {os.environ.get('SDL_RENDER_DRIVER', 'default')}")
+
+
+if __name__ == "__main__":
+    main()
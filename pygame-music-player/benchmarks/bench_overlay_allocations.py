@@ -0,0 +1,78 @@
+"""
+Overlay allocation benchmark.
+Draws the translucent overlays (mini player, video controls, YouTube info
+box) and rebuilds Cover Flow side covers for a number of frames, and
+reports the surfaces the shared SurfacePool had to allocate. In steady
+state every frame should be served from the pool (0 allocations/frame).
+
+Usage: python benchmarks/bench_overlay_allocations.py [frames]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from ui_config import UIConfig
+from renderer import iPodRenderer
+from video_player import VideoPlayer
+from youtube_player import YouTubePlayer
+from cover_flow import CoverFlow
+
+FRAMES = 600
+SONG = (1, "song.mp3", "A Song Title", "An Artist", "An Album", 240.0)
+VIDEO = {"title": "A YouTube video", "uploader": "Someone", "duration": "3:45", "view_count": 12345}
+
+
+def run(name, config, draw, frames):
+    draw()  # Warm up: the first frame fills the pool
+    stats = config.surface_pool.get_stats()
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    elapsed_ms = (time.perf_counter() - start) / frames * 1000
+    after = config.surface_pool.get_stats()
+    allocations = after["allocations"] - stats["allocations"]
+    reuses = after["reuses"] - stats["reuses"]
+    print(f"{name}: {elapsed_ms:.3f} ms/frame, {allocations / frames:.2f} allocations/frame, "
+          f"{reuses / frames:.2f} reuses/frame")
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    config = UIConfig()
+    config.art_async_decode = False
+    screen = pygame.Surface((config.SCREEN_WIDTH, config.DISPLAY_HEIGHT))
+
+    renderer = iPodRenderer(screen, config)
+    run("mini player", config, lambda: renderer.draw_mini_player(SONG, 30.0, SONG[5], True, False), frames)
+
+    video_player = VideoPlayer(config)
+    run("video controls", config, lambda: video_player.draw_video_controls(screen), frames)
+
+    youtube_player = YouTubePlayer(config)
+    youtube_player.current_video = VIDEO
+    run("youtube info box", config, lambda: youtube_player._draw_youtube_video_info(screen, renderer), frames)
+
+    # Cover Flow: a new cover in a side slot every frame (uncached, as while scrubbing)
+    cover_flow = CoverFlow(config, None)
+    cover = pygame.Surface((120, 120))
+    cover.fill((40, 90, 160))
+    counter = [0]
+
+    def side_cover():
+        counter[0] += 1
+        cover_flow._get_side_cover_surface(("bench", counter[0]), 1, cover, (120, 120), 0.7, 30, 180)
+        cover_flow._side_cover_cache.clear()
+    run("cover flow side covers", config, side_cover, frames)
+
+    print("pool:", config.surface_pool.get_stats())
+
+
+if __name__ == "__main__":
+    main()
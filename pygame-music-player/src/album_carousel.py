@@ -0,0 +1,142 @@
+"""
+Album carousel module for iPod Classic interface.
+Right-hand pane of the split-view menus: album covers slide in from a
+random direction. Covers and the slide path are resolved once per
+transition, so a frame is just an offset update and at most two blits.
+"""
+import pygame
+import random
+
+
+class AlbumCarousel:
+    """Sliding album art pane with persistent surfaces and precomputed transitions"""
+
+    DIRECTIONS = [
+        (0, -1),  # arriba
+        (0, 1),   # abajo
+        (1, 0),   # derecha
+        (-1, 0),  # izquierda
+        (1, 1),   # diagonal abajo derecha
+        (-1, 1),  # diagonal abajo izquierda
+        (1, -1),  # diagonal arriba derecha
+        (-1, -1)  # diagonal arriba izquierda
+    ]
+
+    def __init__(self, config, area):
+        self.config = config
+        self.area = pygame.Rect(area)
+        self.cover_size = (min(self.area.width - 40, 120), min(self.area.height - 80, 120))
+        self.center = self.area.center
+        self.ambient_interval = 3.0  # Seconds between slow re-slides of the same cover
+        self._empty_cover = None  # "Sin portada" surface, built once
+        self._blank_cover = None  # Plain cover when there is no Cover Flow to load art from
+        self._album = None  # (name, art_path, song_path, artwork_id) being shown
+        self._prev_album = None  # Album sliding out
+        self._prev_handle = None  # (surface, area) sliding out, None if there is none
+        self._next_handle = None  # (surface, area) sliding in
+        self._prev_vector = (0, 0)  # Offset from the center at t=0, shrinks to 0 at t=1
+        self._next_vector = (0, 0)
+        self._start_time = 0.0
+        self._duration = 0.7
+        self._last_change = 0.0
+        self._art_generation = None  # cover_flow.art_generation when the handles were fetched
+
+    @staticmethod
+    def album_info(album):
+        """(name, art_path, song_path, artwork_id) for an album dict or a plain album name"""
+        if isinstance(album, dict):
+            return (album.get("name") or album.get("label"), album.get("art_path"),
+                    album.get("song_path"), album.get("artwork_id"))
+        return str(album), None, None, None
+
+    def draw(self, screen, album_list, index, cover_flow=None, lookahead=(1,)):
+        """Draw the cover of album_list[index], starting a transition when it changes.
+        lookahead: offsets of the albums likely to be shown next, fetched ahead of time."""
+        if not album_list:
+            empty_cover = self._get_empty_cover()
+            screen.blit(empty_cover, empty_cover.get_rect(center=self.center))
+            return
+        now = pygame.time.get_ticks() / 1000.0
+        if cover_flow:
+            # Las filas de álbumes ya traen su carátula: sin consultas por álbum
+            for offset in (0,) + tuple(lookahead):
+                entry = album_list[(index + offset) % len(album_list)]
+                if isinstance(entry, dict):
+                    cover_flow.remember_artwork(entry)
+        album = self.album_info(album_list[index])
+        if album != self._album:
+            self._start_transition(album, now, 0.7 + random.random() * 0.5, cover_flow)
+            # Pedir ya las portadas que probablemente se muestren después
+            if cover_flow:
+                for offset in lookahead:
+                    name, art_path, song_path, artwork_id = self.album_info(album_list[(index + offset) % len(album_list)])
+                    cover_flow.get_album_art_handle(name, art_path, self.cover_size, song_path, artwork_id)
+        elif now - self._last_change > self.ambient_interval:
+            # Animación lenta y cambio de dirección cada 3 segundos
+            self._start_transition(album, now, 2.5 + random.random() * 1.0, cover_flow)
+        elif cover_flow and cover_flow.art_generation != self._art_generation:
+            # Llegaron carátulas decodificadas: sustituir los placeholders
+            self._fetch_handles(cover_flow)
+
+        t = min(1.0, (now - self._start_time) / self._duration)
+        remaining = 1.0 - t
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.area)
+        if self._prev_handle is not None and t < 1.0:
+            self._blit_handle(screen, self._prev_handle, self._prev_vector, remaining)
+        self._blit_handle(screen, self._next_handle, self._next_vector, remaining)
+        screen.set_clip(previous_clip)
+
+    def _start_transition(self, album, now, duration, cover_flow):
+        """Pick a direction and fetch both covers once for the whole slide"""
+        dx, dy = random.choice(self.DIRECTIONS)
+        self._prev_album = self._album  # None on the first cover: nothing slides out
+        self._album = album
+        self._prev_vector = (-dx * self.area.width * 0.7, -dy * self.area.height * 0.7)
+        self._next_vector = (dx * self.area.width, dy * self.area.height)
+        self._start_time = now
+        self._duration = duration
+        self._last_change = now
+        self._fetch_handles(cover_flow)
+
+    def _fetch_handles(self, cover_flow):
+        """Resolve the (surface, area) handles of the previous and current covers"""
+        if cover_flow:
+            # Antes de pedir las portadas: si al pedirlas se reutiliza un slot del atlas
+            # (p.ej. la nueva desaloja a la anterior), el siguiente frame vuelve a pedirlas
+            self._art_generation = cover_flow.art_generation
+            self._prev_handle = None
+            if self._prev_album is not None:
+                self._prev_handle = cover_flow.get_album_art_handle(self._prev_album[0], self._prev_album[1],
+                                                                    self.cover_size, self._prev_album[2], self._prev_album[3])
+            self._next_handle = cover_flow.get_album_art_handle(self._album[0], self._album[1],
+                                                                self.cover_size, self._album[2], self._album[3])
+        else:
+            cover = self._get_blank_cover()
+            self._next_handle = (cover, cover.get_rect())
+            self._prev_handle = self._next_handle if self._prev_album is not None else None
+
+    def _blit_handle(self, screen, handle, vector, remaining):
+        surface, area = handle
+        rect = pygame.Rect((0, 0), area.size)
+        rect.center = (self.center[0] + int(vector[0] * remaining), self.center[1] + int(vector[1] * remaining))
+        screen.blit(surface, rect, area)
+
+    def _get_blank_cover(self):
+        """Plain cover used when there is no Cover Flow to load art from"""
+        if self._blank_cover is None:
+            self._blank_cover = pygame.Surface(self.cover_size)
+            self._blank_cover.fill(self.config.NOW_PLAYING_ALBUM_ART_BG)
+        return self._blank_cover
+
+    def _get_empty_cover(self):
+        """Placeholder shown when there are no albums at all"""
+        if self._empty_cover is None:
+            art = pygame.Surface(self.cover_size)
+            art.fill(self.config.NOW_PLAYING_ALBUM_ART_BG)
+            pygame.draw.rect(art, self.config.ALBUM_ART_BORDER_COLOR, art.get_rect(), 1)
+            font = pygame.font.SysFont(None, 18)
+            text = font.render("Sin portada", True, self.config.ALBUM_ART_BORDER_COLOR)
+            art.blit(text, text.get_rect(center=(self.cover_size[0] // 2, self.cover_size[1] // 2)))
+            self._empty_cover = art
+        return self._empty_cover
@@ -0,0 +1,62 @@
+"""
+Album source module for iPod Classic interface.
+Gives Cover Flow a list-like view of the album index that only loads
+the pages of albums around the covers being shown, so entering Cover
+Flow costs the same with ten albums or ten thousand.
+"""
+from collections import OrderedDict
+
+
+class WindowedAlbumSource:
+    """Read-only sequence of album dicts backed by the database album index.
+
+    Albums are fetched in pages of page_size rows on first access; at most
+    max_pages pages stay in memory, dropped in LRU order.
+    """
+
+    def __init__(self, db, page_size=32, max_pages=8):
+        self.db = db
+        self.page_size = max(1, page_size)
+        self.max_pages = max(1, max_pages)
+        self.pages = OrderedDict()  # page number -> list of album dicts
+        self.page_loads = 0
+        self._length = db.get_album_count()
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("album index out of range")
+        page_number, offset = divmod(index, self.page_size)
+        page = self.pages.get(page_number)
+        if page is None:
+            page = self._load_page(page_number)
+        else:
+            self.pages.move_to_end(page_number)
+        return page[offset]
+
+    def _load_page(self, page_number):
+        """Fetch one page of albums from the database, evicting the oldest page if needed"""
+        rows = self.db.get_album_window(page_number * self.page_size, self.page_size)
+        page = [{
+            "name": name,
+            "art_path": art_path,  # cover.jpg/folder.png indexado al escanear
+            "song_path": song_path,
+            "artwork_id": artwork_id,  # Carátula única (por hash) extraída al escanear
+            "artwork": artwork  # (art_hash, source_path, source_kind, color), leída con la página
+        } for name, song_path, art_path, artwork_id, artwork in rows]
+        self.pages[page_number] = page
+        self.page_loads += 1
+        while len(self.pages) > self.max_pages:
+            self.pages.popitem(last=False)
+        return page
+
+    def get_stats(self):
+        return {
+            "albums": self._length,
+            "pages_loaded": len(self.pages),
+            "page_loads": self.page_loads,
+        }
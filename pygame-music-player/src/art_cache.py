@@ -0,0 +1,211 @@
+"""
+Album art cache module for iPod Classic interface.
+Size-aware LRU cache for album art surfaces with separate byte budgets
+for full-size (raw) images and scaled thumbnails, texture atlases
+for the fixed thumbnail sizes used by the UI, and a compressed tier
+that keeps evicted thumbnails as zlib-packed pixels.
+"""
+import pygame
+import zlib
+from collections import OrderedDict
+from thumbnail_atlas import ThumbnailAtlas
+
+
+def surface_nbytes(surface):
+    """Approximate memory used by a pygame surface's pixel buffer"""
+    try:
+        return surface.get_pitch() * surface.get_height()
+    except Exception:
+        return 0
+
+
+class _LRUTier:
+    """Single LRU tier bounded by a byte budget"""
+
+    def __init__(self, budget_bytes, on_evict=None):
+        self.budget_bytes = budget_bytes
+        self.on_evict = on_evict  # Called as on_evict(key, value) for entries pushed out by the budget
+        self.entries = OrderedDict()  # key -> (value, nbytes)
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, nbytes=None):
+        """Store a surface (or any value with an explicit nbytes)"""
+        self.discard(key)
+        if nbytes is None:
+            nbytes = surface_nbytes(value)
+        if nbytes > self.budget_bytes:
+            # Never keep an entry that alone exceeds the budget
+            return
+        self.entries[key] = (value, nbytes)
+        self.bytes_used += nbytes
+        while self.bytes_used > self.budget_bytes and self.entries:
+            old_key, (old_value, old_nbytes) = self.entries.popitem(last=False)
+            self.bytes_used -= old_nbytes
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(old_key, old_value)
+
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes_used -= entry[1]
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def get_stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes_used": self.bytes_used,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class AlbumArtCache:
+    """LRU cache for album art surfaces, bounded by surface bytes.
+
+    Full-size decoded images ('raw') and scaled thumbnails live in separate
+    tiers so a few huge originals can never push out every thumbnail.
+    Thumbnails of an atlas size are packed into a ThumbnailAtlas instead;
+    get() then returns a view of the cover's atlas slot.
+
+    Thumbnails evicted from the surface tiers are demoted to a compressed
+    tier (zlib-packed RGB, a fraction of the surface size) and promoted
+    back to a surface on the next request instead of being decoded again.
+    """
+
+    RAW = 'raw'
+    COMPRESSED_FORMAT = 'RGB'
+    COMPRESSION_LEVEL = 1  # Fast: demotion happens on the main thread
+
+    def __init__(self, raw_budget_bytes=8 * 1024 * 1024, scaled_budget_bytes=6 * 1024 * 1024,
+                 atlas_sizes=(), atlas_slots=48, compressed_budget_bytes=4 * 1024 * 1024):
+        self.raw_tier = _LRUTier(raw_budget_bytes)
+        self.scaled_tier = _LRUTier(scaled_budget_bytes, on_evict=self._demote)
+        self.compressed_tier = _LRUTier(compressed_budget_bytes)
+        self.atlases = {
+            tuple(size): ThumbnailAtlas(size, max_slots=atlas_slots,
+                                        on_evict=lambda key, view, size=tuple(size): self._demote((key, size), view))
+            for size in atlas_sizes
+        }
+        self.promotions = 0
+        self.demotions = 0
+        self.generation = 0  # Bumped on every write: held (page, rect) handles may point at another cover
+
+    def _tier_for(self, size):
+        return self.raw_tier if size == self.RAW else self.scaled_tier
+
+    def _atlas_for(self, size):
+        if size == self.RAW:
+            return None
+        return self.atlases.get(tuple(size))
+
+    def _demote(self, key_and_size, surface):
+        """Keep an evicted thumbnail as compressed pixels"""
+        if self.compressed_tier.budget_bytes <= 0:
+            return
+        self.demotions += 1
+        if key_and_size in self.compressed_tier.entries:
+            self.compressed_tier.entries.move_to_end(key_and_size)  # Already packed when it was promoted
+            return
+        data = zlib.compress(pygame.image.tostring(surface, self.COMPRESSED_FORMAT), self.COMPRESSION_LEVEL)
+        self.compressed_tier.put(key_and_size, data, nbytes=len(data))
+
+    def _promote(self, key, size):
+        """Rebuild a surface from the compressed tier into the surface tiers, or None"""
+        if size == self.RAW:
+            return None
+        data = self.compressed_tier.get((key, size))
+        if data is None:
+            return None
+        self.promotions += 1
+        surface = pygame.image.fromstring(zlib.decompress(data), tuple(size), self.COMPRESSED_FORMAT)
+        return self.put(key, size, surface)
+
+    def get(self, key, size):
+        """Return the cached surface for (key, size) or None"""
+        atlas = self._atlas_for(size)
+        if atlas is not None:
+            surface = atlas.get_surface(key)
+        else:
+            surface = self._tier_for(size).get((key, size))
+        if surface is None:
+            surface = self._promote(key, size)
+        return surface
+
+    def get_handle(self, key, size):
+        """Return (surface, area rect) to blit a cached thumbnail from, or None.
+        For atlas sizes this is the atlas page and the cover's slot."""
+        atlas = self._atlas_for(size)
+        if atlas is not None:
+            handle = atlas.get_handle(key)
+            if handle is None and self._promote(key, size) is not None:
+                handle = atlas.get_handle(key)
+            return handle
+        surface = self.get(key, size)
+        if surface is None:
+            return None
+        return surface, surface.get_rect()
+
+    def put(self, key, size, surface):
+        """Store a surface for (key, size), evicting least recently used entries.
+        Returns the surface callers should use (the atlas view for atlas sizes)."""
+        self.generation += 1
+        atlas = self._atlas_for(size)
+        if atlas is not None:
+            return atlas.put(key, surface)
+        self._tier_for(size).put((key, size), surface)
+        return surface
+
+    def discard(self, key, size):
+        """Remove a single entry if present"""
+        self.generation += 1
+        self.compressed_tier.discard((key, size))
+        atlas = self._atlas_for(size)
+        if atlas is not None:
+            atlas.discard(key)
+            return
+        self._tier_for(size).discard((key, size))
+
+    def clear(self):
+        """Drop every cached surface (statistics are kept)"""
+        self.generation += 1
+        self.raw_tier.clear()
+        self.scaled_tier.clear()
+        self.compressed_tier.clear()
+        for atlas in self.atlases.values():
+            atlas.clear()
+
+    def __contains__(self, key_and_size):
+        key, size = key_and_size
+        if key_and_size in self.compressed_tier.entries:
+            return True  # Promoting it is cheap, no decode needed
+        atlas = self._atlas_for(size)
+        if atlas is not None:
+            return key in atlas
+        return (key, size) in self._tier_for(size).entries
+
+    def get_stats(self):
+        """Return hit/miss/eviction counters and memory use for each tier"""
+        return {
+            "raw": self.raw_tier.get_stats(),
+            "scaled": self.scaled_tier.get_stats(),
+            "atlas": {f"{size[0]}x{size[1]}": atlas.get_stats() for size, atlas in self.atlases.items()},
+            "compressed": dict(self.compressed_tier.get_stats(), promotions=self.promotions, demotions=self.demotions),
+        }
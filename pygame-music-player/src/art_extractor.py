@@ -0,0 +1,260 @@
+"""
+Album art extraction module for iPod Classic interface.
+Reads embedded cover art from MP3 (ID3 APIC), FLAC (PICTURE blocks),
+Ogg Vorbis/Opus (METADATA_BLOCK_PICTURE) and MP4/M4A (covr atoms),
+touching only the metadata region of each file - never the audio data.
+Also computes the dominant color of a cover for art-tinted backgrounds.
+"""
+import base64
+import hashlib
+import io
+import struct
+try:
+    from mutagen.id3 import ID3
+    from mutagen.flac import Picture
+    from mutagen.ogg import OggPage
+except ImportError:
+    ID3 = None
+    Picture = None
+    OggPage = None
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+COLOR_ANALYSIS_AVAILABLE = Image is not None
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+FRONT_COVER = 3  # ID3/FLAC picture type for the front cover
+SUPPORTED_MIMES = ('image/jpeg', 'image/jpg', 'image/png')
+MAX_OGG_HEADER_PAGES = 256  # Safety limit while looking for the comment packet
+COLOR_SAMPLE_SIZE = 32  # Covers are downsampled to this size before color analysis
+COLOR_BITS = 3  # Bits per channel when grouping similar colors
+
+
+def hash_art(image_bytes):
+    """Content hash used to identify a piece of artwork in the caches"""
+    return hashlib.sha1(image_bytes).hexdigest()
+
+
+def extract_embedded_art(path):
+    """Return (image_bytes, art_hash) for the front cover embedded in an audio file, or None"""
+    try:
+        with open(path, 'rb') as f:
+            magic = f.read(12)
+            f.seek(0)
+            image_bytes = None
+            if magic[:3] == b'ID3':
+                image_bytes = _extract_id3(path, f)
+            elif magic[:4] == b'fLaC':
+                image_bytes = _extract_flac(f)
+            elif magic[:4] == b'OggS':
+                image_bytes = _extract_ogg(f)
+            elif magic[4:8] == b'ftyp':
+                image_bytes = _extract_mp4(f)
+    except Exception as e:
+        print(f"Error extrayendo carátula de {path}: {e}")
+        return None
+    if not image_bytes:
+        return None
+    return image_bytes, hash_art(image_bytes)
+
+
+def dominant_color(image_bytes):
+    """Return the dominant (r, g, b) of an encoded cover, or None without PIL.
+
+    The cover is decoded at reduced size and downsampled; pixels are grouped
+    into coarse color bins and the mean of the most populated bin is used.
+    Without NumPy the plain average color is returned.
+    """
+    if Image is None:
+        return None
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        img.draft('RGB', (COLOR_SAMPLE_SIZE * 2, COLOR_SAMPLE_SIZE * 2))
+        img = img.convert('RGB').resize((COLOR_SAMPLE_SIZE, COLOR_SAMPLE_SIZE), Image.BOX)
+    except Exception as e:
+        print(f"Error analizando color de carátula: {e}")
+        return None
+    if numpy is None:
+        return img.resize((1, 1), Image.BOX).getpixel((0, 0))
+    pixels = numpy.asarray(img, dtype=numpy.uint8).reshape(-1, 3)
+    shift = 8 - COLOR_BITS
+    bins = ((pixels[:, 0] >> shift).astype(numpy.intp) << (2 * COLOR_BITS)) \
+        | ((pixels[:, 1] >> shift).astype(numpy.intp) << COLOR_BITS) \
+        | (pixels[:, 2] >> shift).astype(numpy.intp)
+    dominant_bin = numpy.bincount(bins).argmax()
+    return tuple(int(round(c)) for c in pixels[bins == dominant_bin].mean(axis=0))
+
+
+def _pick_front_cover(pictures):
+    """Pick the front cover from (type, mime, data) tuples, falling back to the first usable image"""
+    usable = [p for p in pictures if (p[1] or '').lower() in SUPPORTED_MIMES or not p[1]]
+    for picture_type, _mime, data in usable:
+        if picture_type == FRONT_COVER:
+            return data
+    return usable[0][2] if usable else None
+
+
+def _extract_id3(path, f):
+    """ID3v2 APIC frames (MP3, also ID3-prefixed FLAC)"""
+    if ID3 is None:
+        return None
+    # Only the tag header and tag body are read, not the MPEG frames
+    header = f.read(10)
+    flags = header[5]
+    tag_size = _syncsafe(header[6:10]) + 10 + (10 if flags & 0x10 else 0)
+    tags = ID3(path, load_v1=False)
+    pictures = [(frame.type, frame.mime, frame.data) for frame in tags.getall('APIC')]
+    image_bytes = _pick_front_cover(pictures)
+    if image_bytes is None:
+        f.seek(tag_size)
+        if f.read(4) == b'fLaC':
+            image_bytes = _extract_flac(f, offset=tag_size)
+    return image_bytes
+
+
+def _syncsafe(data):
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _extract_flac(f, offset=0):
+    """FLAC METADATA_BLOCK_PICTURE blocks, skipping every other metadata block"""
+    if Picture is None:
+        return None
+    f.seek(offset + 4)  # After 'fLaC'
+    pictures = []
+    while True:
+        block_header = f.read(4)
+        if len(block_header) < 4:
+            break
+        is_last = block_header[0] & 0x80
+        block_type = block_header[0] & 0x7F
+        block_size = int.from_bytes(block_header[1:4], 'big')
+        if block_type == 6:  # PICTURE
+            picture = Picture(f.read(block_size))
+            pictures.append((picture.type, picture.mime, picture.data))
+        else:
+            f.seek(block_size, 1)
+        if is_last:
+            break
+    return _pick_front_cover(pictures)
+
+
+def _extract_ogg(f):
+    """Vorbis/Opus comment METADATA_BLOCK_PICTURE fields from the first logical stream's header pages"""
+    if OggPage is None or Picture is None:
+        return None
+    first_page = OggPage(f)
+    serial = first_page.serial
+    pages = [first_page]
+    comment_packet = None
+    for _ in range(MAX_OGG_HEADER_PAGES):
+        try:
+            page = OggPage(f)
+        except Exception:
+            break
+        if page.serial != serial:
+            continue
+        pages.append(page)
+        if page.complete:
+            packets = OggPage.to_packets(pages, strict=False)
+            if len(packets) >= 2:
+                comment_packet = packets[1]
+                break
+    if comment_packet is None:
+        return None
+
+    if comment_packet.startswith(b'\x03vorbis'):
+        comment_data = comment_packet[7:]
+    elif comment_packet.startswith(b'OpusTags'):
+        comment_data = comment_packet[8:]
+    else:
+        return None
+
+    pictures = []
+    for key, value in _parse_vorbis_comment(comment_data):
+        if key == 'METADATA_BLOCK_PICTURE':
+            try:
+                picture = Picture(base64.b64decode(value))
+                pictures.append((picture.type, picture.mime, picture.data))
+            except Exception:
+                continue
+        elif key == 'COVERART':  # Legacy unofficial field: raw base64 image
+            try:
+                pictures.append((None, None, base64.b64decode(value)))
+            except Exception:
+                continue
+    return _pick_front_cover(pictures)
+
+
+def _parse_vorbis_comment(data):
+    """Yield (KEY, value) pairs from a Vorbis comment block"""
+    offset = 0
+    vendor_length = struct.unpack_from('<I', data, offset)[0]
+    offset += 4 + vendor_length
+    count = struct.unpack_from('<I', data, offset)[0]
+    offset += 4
+    for _ in range(count):
+        length = struct.unpack_from('<I', data, offset)[0]
+        offset += 4
+        entry = data[offset:offset + length]
+        offset += length
+        key, sep, value = entry.partition(b'=')
+        if sep:
+            yield key.decode('ascii', 'replace').upper(), value
+
+
+def _iter_atoms(f, start, end):
+    """Yield (name, data_start, data_end) for MP4 atoms between start and end, reading only headers"""
+    position = start
+    while end is None or position + 8 <= end:
+        f.seek(position)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, name = struct.unpack('>I4s', header)
+        data_start = position + 8
+        if size == 1:  # 64-bit extended size
+            size = struct.unpack('>Q', f.read(8))[0]
+            data_start += 8
+        elif size == 0:  # Atom extends to the end of the file
+            f.seek(0, 2)
+            size = f.tell() - position
+        if size < 8:
+            return
+        yield name, data_start, position + size
+        position += size
+
+
+def _find_atom(f, path, start=0, end=None):
+    """Descend into nested atoms following path, returning (data_start, data_end) or None"""
+    for wanted in path:
+        for name, data_start, data_end in _iter_atoms(f, start, end):
+            if name == wanted:
+                start, end = data_start, data_end
+                if wanted == b'meta':
+                    start += 4  # 'meta' is a full atom: skip version/flags
+                break
+        else:
+            return None
+    return start, end
+
+
+def _extract_mp4(f):
+    """MP4/M4A iTunes 'covr' atom (moov/udta/meta/ilst/covr), without reading the media data"""
+    covr = _find_atom(f, (b'moov', b'udta', b'meta', b'ilst', b'covr'))
+    if covr is None:
+        return None
+    for name, data_start, data_end in _iter_atoms(f, covr[0], covr[1]):
+        if name != b'data' or data_end - data_start <= 8:
+            continue
+        f.seek(data_start)
+        data_type = struct.unpack('>I', f.read(4))[0] & 0xFFFFFF
+        f.read(4)  # Locale
+        if data_type in (0, 13, 14):  # Implicit, JPEG, PNG
+            return f.read(data_end - data_start - 8)
+    return None
@@ -0,0 +1,65 @@
+"""
+Album art loader module for iPod Classic interface.
+Runs album art extraction and decoding on a background worker pool and
+hands the decoded pixels back to the main thread, which is the only
+place pygame surfaces are created.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AlbumArtLoader:
+    """Background worker pool for album art decoding"""
+
+    def __init__(self, max_workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="album-art")
+        self.pending = {}  # request key -> Future
+        self.completed = 0
+        self.cancelled = 0
+
+    def request(self, key, job, *args):
+        """Queue job(*args) for key unless it is already pending. Returns True if queued."""
+        if key in self.pending:
+            return False
+        try:
+            self.pending[key] = self.executor.submit(job, *args)
+        except RuntimeError:
+            return False  # Pool already shut down
+        return True
+
+    def is_pending(self, key):
+        """Check whether a request for key is queued or running"""
+        return key in self.pending
+
+    def cancel(self, key):
+        """Drop a request that has not started yet. Returns True if it was cancelled."""
+        future = self.pending.get(key)
+        if future is not None and future.cancel():
+            del self.pending[key]
+            self.cancelled += 1
+            return True
+        return False
+
+    def poll(self, max_results=None):
+        """Collect finished requests as (key, result) pairs, called from the main thread"""
+        finished = []
+        for key, future in list(self.pending.items()):
+            if max_results is not None and len(finished) >= max_results:
+                break
+            if not future.done():
+                continue
+            del self.pending[key]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Error decodificando carátula en segundo plano: {e}")
+                result = None
+            self.completed += 1
+            finished.append((key, result))
+        return finished
+
+    def shutdown(self):
+        """Stop the worker pool, discarding queued requests"""
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        self.executor.shutdown(wait=False)
@@ -204,6 +204,11 @@ class ClickWheel:
             self.wheel_momentum *= self.momentum_decay
         else:
             self.wheel_momentum = 0
+
+    def get_visual_state(self):
+        """Everything draw() depends on: the wheel only needs redrawing when this changes"""
+        return (self.button_highlight, self.center_button_pressed, self.ui_config.font_small)
+
     def draw(self, screen):
         """Draw the Click Wheel on the screen"""
         # Draw background for the Click Wheel area
@@ -4,129 +4,418 @@ Handles album art display and Cover Flow navigation with animations.
 """
 import pygame
 import os
+import math
 from pathlib import Path
 import io
-try:
-    from mutagen.mp3 import MP3
-    from mutagen.id3 import ID3, APIC
-except ImportError:
-    MP3 = None
-    ID3 = None
-    APIC = None
+from art_cache import AlbumArtCache
+from album_source import WindowedAlbumSource
+from art_loader import AlbumArtLoader
+from thumbnail_store import ThumbnailStore
+from surface_effects import make_reflection, perspective_warp
+from art_extractor import extract_embedded_art, hash_art
 try:
     from PIL import Image
 except ImportError:
     Image = None
 
 
+def open_art_image(image_data, max_size):
+    """Open encoded cover bytes with PIL, decoding no larger than needed for max_size.
+
+    JPEGs use draft mode (DCT scaling by 1/2, 1/4 or 1/8 while decoding);
+    other formats are reduced by an integer factor. Opaque art stays RGB,
+    only images with transparency are converted to RGBA.
+    """
+    pil_img = Image.open(io.BytesIO(image_data))
+    if pil_img.format == 'JPEG':
+        pil_img.draft('RGB', tuple(max_size))
+    has_alpha = 'A' in pil_img.getbands() or 'transparency' in pil_img.info
+    mode = 'RGBA' if has_alpha else 'RGB'
+    if pil_img.mode != mode:
+        pil_img = pil_img.convert(mode)
+    factor = min(pil_img.width // max(1, max_size[0]), pil_img.height // max(1, max_size[1]))
+    if factor >= 2:
+        pil_img = pil_img.reduce(factor)
+    return pil_img
+
+
 class CoverFlow:
     """Handles Cover Flow functionality and album art management"""
     
-    def __init__(self, config, db):
+    def __init__(self, config, db, thumbnail_store=None):
         self.config = config
         self.db = db
+        self.thumbnail_store = thumbnail_store  # Optional on-disk thumbnail cache
         
         # Cover Flow specific state
-        self.cover_flow_albums = []  # List of album data with art paths
+        self.cover_flow_albums = []  # Album dicts (a WindowedAlbumSource once loaded)
         self.current_cover_flow_index = 0
-        self.cover_art_cache = {}  # Cache for loaded album art
+        # Cache for loaded album art, bounded by surface bytes
+        self.cover_art_cache = AlbumArtCache(
+            raw_budget_bytes=getattr(config, 'art_cache_raw_budget_bytes', 8 * 1024 * 1024),
+            scaled_budget_bytes=getattr(config, 'art_cache_scaled_budget_bytes', 6 * 1024 * 1024),
+            atlas_sizes=getattr(config, 'art_atlas_sizes', ()),
+            atlas_slots=getattr(config, 'art_atlas_slots', 48),
+            compressed_budget_bytes=getattr(config, 'art_cache_compressed_budget_bytes', 4 * 1024 * 1024)
+        )
+        # Background decoding: get_album_art returns a placeholder until the worker finishes
+        self.art_loader = None
+        if getattr(config, 'art_async_decode', True):
+            self.art_loader = AlbumArtLoader(max_workers=getattr(config, 'art_decode_workers', 2))
+        self._loading_placeholders = {}  # (size, color) -> shared "loading" surface
+        self._side_cover_cache = {}  # (cover key, slot) -> (source surface, transformed surface)
+        self._reflection_cache = {}  # cover key -> (source surface, reflection surface)
+        self._preview_cache = {}  # (cover key, size) -> (cached thumbnail, rescaled preview)
+        self._folder_art = {}  # directory -> folder art path (or None), looked up on demand
+        self._artwork_info = {}  # artwork id -> (art_hash, source_path, source_kind, dominant color)
+        self._song_artwork = {}  # song id -> artwork id
+        self._pending_labels = {}  # cache key -> album name for the "no art" placeholder
+        self._placeholder_font = None  # Created on first use (pygame.font must be initialized)
+        self._results_generation = 0  # Bumped whenever background decodes finish
         
         # Cover Flow animation variables
-        self.cover_flow_animation_active = False
-        self.cover_flow_animation_direction = "none"  # "left", "right", "none"
-        self.cover_flow_animation_progress = 0.0  # 0.0 to 1.0
-        self.cover_flow_animation_speed = 8.0  # Higher = faster animation
+        self.cover_flow_animation_active = False  # Position still moving towards the target
+        self.cover_flow_position = 0.0  # Album index shown at the center (fractional while moving)
+        self.cover_flow_animation_speed = 12.0  # Fraction of the remaining distance covered per second
+        self.cover_flow_min_speed = 4.0  # Covers per second, so the last stretch doesn't crawl
         self.cover_flow_target_index = 0
 
+        # Scrubbing: spinning the wheel fast jumps several albums per step
+        self.scrub_velocity_threshold = getattr(config, 'cover_flow_scrub_threshold', 5.0)  # Steps per second
+        self.scrub_max_step = getattr(config, 'cover_flow_scrub_max_step', 32)
+        self.settle_delay_s = getattr(config, 'cover_flow_settle_delay', 0.15)
+        self.scrubbing = False  # Only cached thumbnails/placeholders are drawn until the view settles
+        self.num_side_covers = 2  # Number of covers on each side of the focused one
+        self.side_cover_angle = getattr(config, 'cover_flow_side_angle', 55)  # Perspective turn of side covers (degrees)
+
+        # Neighbor prefetching (decode covers ahead of the direction of travel)
+        self.prefetch_base_count = getattr(config, 'cover_flow_prefetch_count', 4)
+        self.prefetch_max_count = getattr(config, 'cover_flow_prefetch_max', 12)
+        self.prefetch_lookahead_s = 0.75  # Seconds of scrolling to prefetch at current speed
+        self.scroll_velocity = 0.0  # Navigation steps per second, negative = moving left
+        self._last_navigation_time = None
+        self._prefetch_keys = set()
+        self._prefetch_signature = None
+
+    @property
+    def art_generation(self):
+        """Changes whenever cached art may have changed: decodes finished, or any cache write
+        (synchronous puts reuse LRU atlas slots, so held (page, rect) handles must be refetched)"""
+        return self._results_generation + self.cover_art_cache.generation
+
     def load_cover_flow_data(self):
         """Load album data for Cover Flow display"""
-        # Get albums from database
-        albums_from_db = self.db.get_albums()
-        self.cover_flow_albums = []
-        for album_name in albums_from_db:
-            # Buscar una canción de este álbum para extraer la carátula
-            songs = self.db.get_songs_by_album(album_name)
-            song_path = None
-            if songs and len(songs[0]) > 1:
-                song_path = songs[0][1]  # path es el segundo campo
-            self.cover_flow_albums.append({
-                "name": album_name,
-                "art_path": None,  # Se puede mejorar si tienes carátulas externas
-                "song_path": song_path
-            })
+        # Refrescar los índices de carátulas (pueden haber cambiado con un escaneo)
+        self._folder_art = {}
+        self._artwork_info = {}
+        self._song_artwork = {}
+        # Solo se lee de la base de datos la ventana de álbumes alrededor de la portada actual
+        self.cover_flow_albums = WindowedAlbumSource(
+            self.db,
+            page_size=getattr(self.config, 'cover_flow_page_size', 32),
+            max_pages=getattr(self.config, 'cover_flow_max_pages', 8)
+        )
         if not self.cover_flow_albums:
             # Handle case with no albums
             print("No albums found for Cover Flow.")
-            self.cover_flow_albums = [{"name": "No Albums Found", "art_path": None, "song_path": None}]
+            self.cover_flow_albums = [{"name": "No Albums Found", "art_path": None, "song_path": None, "artwork_id": None}]
         self.current_cover_flow_index = 0
+        self.cover_flow_position = 0.0
+        self.cover_flow_target_index = 0
+        self.cover_flow_animation_active = False
+        self.scrubbing = False
+
+    def resolve_art_path(self, song_path):
+        """Return the indexed folder art file for a song's directory, or None (no file I/O)"""
+        if not song_path:
+            return None
+        directory = str(Path(song_path).parent)
+        if directory not in self._folder_art:
+            self._folder_art[directory] = self.db.get_folder_art_path(directory)
+        return self._folder_art[directory]
 
-    def get_album_art(self, album_name, art_path=None, size=(80, 80), song_path=None):
+    def resolve_song_artwork(self, song_id):
+        """Return the artwork id recorded for a song at scan time, or None"""
+        if song_id not in self._song_artwork:
+            self._song_artwork[song_id] = self.db.get_song_artwork_id(song_id)
+        return self._song_artwork[song_id]
+
+    def get_artwork_color(self, artwork_id):
+        """Return the dominant (r, g, b) computed at scan time for an artwork, or None"""
+        artwork = self._get_artwork(artwork_id)
+        return artwork[3] if artwork is not None else None
+
+    def _get_artwork(self, artwork_id):
+        """Artwork row for an id, memoized (None if unknown)"""
+        if not artwork_id:
+            return None
+        if artwork_id not in self._artwork_info:
+            self._artwork_info[artwork_id] = self.db.get_artwork(artwork_id)
+        return self._artwork_info[artwork_id]
+
+    def _art_source(self, album_name, art_path, song_path, artwork_id=None):
+        """Resolve (cache key, art_path, song_path, known art hash) for a cover.
+
+        Covers with an artwork id are keyed by it, so every album/track sharing
+        the same image is decoded and cached once."""
+        artwork = self._get_artwork(artwork_id)
+        if artwork is not None:
+            art_hash, source_path, source_kind, _color = artwork
+            if source_kind == 'folder':
+                return ('artwork', artwork_id), source_path, None, art_hash
+            return ('artwork', artwork_id), None, source_path, art_hash
+        return (album_name, art_path, song_path), art_path, song_path, None
+
+    def remember_artwork(self, album_data):
+        """Seed the artwork memo with the row an album entry brought from its page query,
+        so covers of albums never cost a database lookup of their own"""
+        artwork_id = album_data.get("artwork_id")
+        if artwork_id and album_data.get("artwork") is not None:
+            self._artwork_info[artwork_id] = album_data["artwork"]
+
+    def _album_art_source(self, album_data):
+        """_art_source for a Cover Flow album entry"""
+        self.remember_artwork(album_data)
+        return self._art_source(album_data["name"], album_data.get("art_path"),
+                                album_data.get("song_path"), album_data.get("artwork_id"))
+
+    def get_album_art(self, album_name, art_path=None, size=(80, 80), song_path=None, artwork_id=None):
         """Get album art surface, with caching. Tries to extract from audio file metadata if possible."""
-        cache_key = (album_name, art_path, song_path)
-        if cache_key in self.cover_art_cache and size in self.cover_art_cache[cache_key]:
-            return self.cover_art_cache[cache_key][size]
+        cache_key, art_path, song_path, known_hash = self._art_source(album_name, art_path, song_path, artwork_id)
+        cached = self.cover_art_cache.get(cache_key, size)
+        if cached is not None:
+            return cached
 
-        raw_image = None
-        # 1. Intentar extraer carátula de metadatos si hay song_path
-        if song_path and MP3 and ID3 and APIC:
-            try:
-                audio = MP3(song_path, ID3=ID3)
-                found_valid_image = False
-                for tag in audio.tags.values():
-                    if isinstance(tag, APIC):
-                        mime = getattr(tag, 'mime', '').lower()
-                        if mime in ('image/jpeg', 'image/jpg', 'image/png'):
-                            img_data = tag.data
-                            if Image is not None:
-                                img_stream = io.BytesIO(img_data)
-                                try:
-                                    pil_img = Image.open(img_stream).convert('RGBA')
-                                    mode = pil_img.mode
-                                    size = pil_img.size
-                                    data = pil_img.tobytes()
-                                    raw_image = pygame.image.fromstring(data, size, mode)
-                                    found_valid_image = True
-                                    break
-                                except Exception as e:
-                                    print(f"Error abriendo imagen APIC válida: {e}")
-                            else:
-                                img_stream = io.BytesIO(img_data)
-                                try:
-                                    raw_image = pygame.image.load(img_stream)
-                                    found_valid_image = True
-                                    break
-                                except Exception as e:
-                                    print(f"Error abriendo imagen APIC con pygame: {e}")
-                        else:
-                            print(f"Tipo MIME de carátula no soportado: {mime}")
-                if not found_valid_image:
-                    print(f"No se encontró ninguna carátula válida en metadatos para {song_path}")
-            except Exception as e:
-                print(f"Error extrayendo carátula de metadatos: {e}")
-        # 2. Si no se pudo, intentar cargar desde art_path
-        if raw_image is None and art_path and os.path.exists(art_path):
-            try:
-                raw_image = pygame.image.load(art_path).convert_alpha()
-            except Exception as e:
-                print(f"Error cargando imagen de {art_path}: {e}")
-                raw_image = None
-        # 3. Si no hay imagen, crear placeholder
+        # Ya se está decodificando en segundo plano
+        if self.art_loader is not None and self.art_loader.is_pending(cache_key):
+            return self._get_loading_placeholder(size, self.get_artwork_color(artwork_id))
+
+        # Reutilizar la imagen original decodificada si sigue en caché
+        raw_image = self.cover_art_cache.get(cache_key, AlbumArtCache.RAW)
+        if raw_image is not None:
+            scaled_image = pygame.transform.smoothscale(raw_image, size)
+            return self.cover_art_cache.put(cache_key, size, scaled_image)
+
+        # 1. Miniatura ya escalada en disco (sin mutagen ni PIL)
+        source_path = art_path or song_path
+        art_hash = known_hash
+        if self.thumbnail_store and source_path:
+            if art_hash is None:
+                art_hash = self.thumbnail_store.lookup(source_path)
+            if art_hash:
+                thumbnail = self.thumbnail_store.load(art_hash, size)
+                if thumbnail is not None:
+                    return self.cover_art_cache.put(cache_key, size, thumbnail)
+
+        # 2. Decodificar en segundo plano y devolver un placeholder mientras tanto
+        if self.art_loader is not None and art_hash != "":
+            self._request_decode(cache_key, album_name, art_path, song_path, self._job_sizes(size), known_hash)
+            return self._get_loading_placeholder(size, self.get_artwork_color(artwork_id))
+
+        # 3. Decodificar la carátula (salvo que ya sepamos que el archivo no tiene)
+        image_data = None
+        if art_hash != "":
+            image_data, art_hash = self._read_art(song_path, art_path)
+            if image_data is not None:
+                sizes = self._job_sizes(size)
+                max_size = (max(s[0] for s in sizes), max(s[1] for s in sizes))
+                raw_image = self._decode_art_bytes(image_data, max_size)
+                if raw_image is None:
+                    image_data = art_hash = None
+
+        # 4. Si no hay imagen, crear placeholder
         if raw_image is None:
-            raw_image = pygame.Surface((200, 200), pygame.SRCALPHA)
-            raw_image.fill(self.config.NOW_PLAYING_ALBUM_ART_BG)
-            pygame.draw.rect(raw_image, self.config.ALBUM_ART_BORDER_COLOR, raw_image.get_rect(), 1)
-            placeholder_font = pygame.font.SysFont(None, 24)
-            art_text_surf = placeholder_font.render(album_name[:15], True, self.config.ALBUM_ART_BORDER_COLOR)
-            art_text_rect = art_text_surf.get_rect(center=(raw_image.get_width() // 2, raw_image.get_height() // 2))
-            raw_image.blit(art_text_surf, art_text_rect)
+            raw_image = self._make_placeholder(album_name, self.get_artwork_color(artwork_id))
         # Escalar
         scaled_image = pygame.transform.smoothscale(raw_image, size)
+        # Guardar miniaturas en disco para próximos arranques
+        if self.thumbnail_store and source_path:
+            if image_data is not None:
+                self.thumbnail_store.save_all_sizes(art_hash, raw_image, extra_sizes=(size,))
+                self.thumbnail_store.record_source(source_path, art_hash)
+            elif art_hash is None:
+                self.thumbnail_store.record_source(source_path, None)
         # Cachear
-        if cache_key not in self.cover_art_cache:
-            self.cover_art_cache[cache_key] = {}
-        self.cover_art_cache[cache_key][size] = scaled_image
-        self.cover_art_cache[cache_key]['raw'] = raw_image
-        return scaled_image
+        self.cover_art_cache.put(cache_key, AlbumArtCache.RAW, raw_image)
+        return self.cover_art_cache.put(cache_key, size, scaled_image)
+
+    def get_album_art_handle(self, album_name, art_path=None, size=(80, 80), song_path=None, artwork_id=None):
+        """Like get_album_art, but return (surface, area) to blit from: the atlas page and slot rect
+        for atlas-sized thumbnails, so menus blit straight from the atlas"""
+        cache_key = self._art_source(album_name, art_path, song_path, artwork_id)[0]
+        handle = self.cover_art_cache.get_handle(cache_key, size)
+        if handle is not None:
+            return handle
+        surface = self.get_album_art(album_name, art_path, size, song_path, artwork_id)
+        return self.cover_art_cache.get_handle(cache_key, size) or (surface, surface.get_rect())
+
+    def get_album_art_preview(self, album_name, art_path=None, size=(80, 80), song_path=None, artwork_id=None):
+        """Album art for a cover passing by while scrubbing: never reads or decodes anything.
+
+        Uses the cached thumbnail of the requested size, else a cached thumbnail
+        of another size rescaled (fast, no smoothing), else a placeholder."""
+        cache_key = self._art_source(album_name, art_path, song_path, artwork_id)[0]
+        size = tuple(size)
+        cached = self.cover_art_cache.get(cache_key, size)
+        if cached is not None:
+            return cached
+        for other_size in ThumbnailStore.THUMBNAIL_SIZES:
+            if other_size == size or (cache_key, other_size) not in self.cover_art_cache:
+                continue
+            source = self.cover_art_cache.get(cache_key, other_size)
+            if source is None:
+                continue
+            entry = self._preview_cache.get((cache_key, size))
+            if entry is None or entry[0] is not source:
+                entry = (source, pygame.transform.scale(source, size))
+                self._preview_cache[(cache_key, size)] = entry
+            return entry[1]
+        return self._get_loading_placeholder(size, self.get_artwork_color(artwork_id))
+
+    def _job_sizes(self, size=None):
+        """Sizes produced by one background decode: every UI thumbnail size plus the requested one"""
+        sizes = ThumbnailStore.THUMBNAIL_SIZES
+        if size is not None:
+            sizes = sizes + (tuple(size),)
+        return tuple(dict.fromkeys(sizes))
+
+    def _request_decode(self, cache_key, album_name, art_path, song_path, sizes, known_hash=None):
+        """Queue a background decode for cache_key, remembering the album name for its placeholder"""
+        if self.art_loader.request(cache_key, self._decode_art_job, art_path, song_path, sizes, known_hash):
+            self._pending_labels[cache_key] = album_name
+
+    def _decode_art_job(self, art_path, song_path, sizes, known_hash=None):
+        """Worker-thread job: extract, decode and scale a cover without creating pygame surfaces"""
+        source_path = art_path or song_path
+        if self.thumbnail_store and source_path:
+            art_hash = known_hash or self.thumbnail_store.lookup(source_path)
+            if art_hash == "":
+                return None  # Known to have no artwork
+            if art_hash:
+                thumbnails = {size: self.thumbnail_store.load_bytes(art_hash, size) for size in sizes}
+                if all(data is not None for data in thumbnails.values()):
+                    return {"thumbnails": thumbnails}
+        image_data, art_hash = self._read_art(song_path, art_path)
+        if image_data is None:
+            if self.thumbnail_store and source_path:
+                self.thumbnail_store.record_source(source_path, None)
+            return None
+        if Image is None:
+            # Sin PIL solo pygame puede decodificar; se hace en el hilo principal
+            return {"encoded": image_data, "art_hash": art_hash, "source_path": source_path}
+        try:
+            max_size = (max(size[0] for size in sizes), max(size[1] for size in sizes))
+            pil_img = open_art_image(image_data, max_size).convert('RGB')
+        except Exception as e:
+            print(f"Error abriendo imagen de carátula: {e}")
+            return None
+        thumbnails = {}
+        for size in sizes:
+            data = pil_img.resize(size, Image.LANCZOS).tobytes()
+            thumbnails[size] = data
+            if self.thumbnail_store:
+                self.thumbnail_store.save_bytes(art_hash, size, data)
+        if self.thumbnail_store and source_path:
+            self.thumbnail_store.record_source(source_path, art_hash)
+        return {"thumbnails": thumbnails}
+
+    def process_art_results(self, max_results=4):
+        """Turn finished background decodes into cached surfaces (main thread, once per frame)"""
+        if self.art_loader is None:
+            return 0
+        finished = self.art_loader.poll(max_results=max_results)
+        if finished:
+            self._results_generation += 1
+        for cache_key, result in finished:
+            album_name = self._pending_labels.pop(cache_key, "")
+            if result and "thumbnails" in result:
+                for size, data in result["thumbnails"].items():
+                    self.cover_art_cache.put(cache_key, size, pygame.image.fromstring(data, size, ThumbnailStore.PIXEL_FORMAT))
+                continue
+            raw_image = None
+            if result and "encoded" in result:
+                raw_image = self._decode_art_bytes(result["encoded"])
+                if raw_image is not None and self.thumbnail_store and result["source_path"]:
+                    self.thumbnail_store.save_all_sizes(result["art_hash"], raw_image)
+                    self.thumbnail_store.record_source(result["source_path"], result["art_hash"])
+            if raw_image is None:
+                raw_image = self._make_placeholder(album_name)
+            self.cover_art_cache.put(cache_key, AlbumArtCache.RAW, raw_image)
+        return len(finished)
+
+    def _get_loading_placeholder(self, size, color=None):
+        """Shared placeholder shown while a cover is being decoded, tinted with its dominant color if known"""
+        key = (tuple(size), color)
+        placeholder = self._loading_placeholders.get(key)
+        if placeholder is None:
+            if len(self._loading_placeholders) >= 64:
+                self._loading_placeholders.clear()  # Un color por carátula: no dejar que crezca sin límite
+            placeholder = pygame.Surface(key[0])
+            placeholder.fill(color or self.config.NOW_PLAYING_ALBUM_ART_BG)
+            pygame.draw.rect(placeholder, self.config.ALBUM_ART_BORDER_COLOR, placeholder.get_rect(), 1)
+            self._loading_placeholders[key] = placeholder
+        return placeholder
+
+    def shutdown(self):
+        """Stop background art workers"""
+        if self.art_loader is not None:
+            self.art_loader.shutdown()
+
+    def _read_art(self, song_path, art_path):
+        """Return (encoded image bytes, art hash) from the external art file or the song's embedded art.
+        Returns (None, None) when there is no artwork."""
+        # Preferir la carátula de carpeta indexada: no hace falta abrir el audio
+        if art_path and os.path.exists(art_path):
+            try:
+                with open(art_path, 'rb') as f:
+                    image_data = f.read()
+                return image_data, hash_art(image_data)
+            except OSError as e:
+                print(f"Error cargando imagen de {art_path}: {e}")
+        # Carátula embebida (MP3, FLAC, Ogg, MP4) leyendo solo la cabecera de metadatos
+        if song_path:
+            embedded = extract_embedded_art(song_path)
+            if embedded is not None:
+                return embedded
+        return None, None
+
+    def _decode_art_bytes(self, image_data, max_size=None):
+        """Decode encoded image bytes into a pygame surface, or None.
+        With PIL and max_size, the image is decoded at reduced resolution."""
+        img_stream = io.BytesIO(image_data)
+        if Image is not None:
+            try:
+                if max_size is not None:
+                    pil_img = open_art_image(image_data, max_size)
+                else:
+                    pil_img = Image.open(img_stream)
+                    pil_img = pil_img.convert('RGBA' if 'A' in pil_img.getbands() else 'RGB')
+                return pygame.image.fromstring(pil_img.tobytes(), pil_img.size, pil_img.mode)
+            except Exception as e:
+                print(f"Error abriendo imagen de carátula: {e}")
+                return None
+        try:
+            return pygame.image.load(img_stream)
+        except Exception as e:
+            print(f"Error abriendo imagen de carátula con pygame: {e}")
+            return None
+
+    def _make_placeholder(self, album_name, color=None):
+        """Create the generic cover shown for albums without (decodable) artwork"""
+        placeholder = pygame.Surface((200, 200), pygame.SRCALPHA)
+        placeholder.fill(color or self.config.NOW_PLAYING_ALBUM_ART_BG)
+        pygame.draw.rect(placeholder, self.config.ALBUM_ART_BORDER_COLOR, placeholder.get_rect(), 1)
+        if self._placeholder_font is None:
+            self._placeholder_font = pygame.font.SysFont(None, 24)
+        album_name = self.config.fit_text(self._placeholder_font, album_name, placeholder.get_width() - 16)
+        art_text_surf = self._placeholder_font.render(album_name, True, self.config.ALBUM_ART_BORDER_COLOR)
+        art_text_rect = art_text_surf.get_rect(center=(placeholder.get_width() // 2, placeholder.get_height() // 2))
+        placeholder.blit(art_text_surf, art_text_rect)
+        return placeholder
+
+    def get_art_cache_stats(self):
+        """Get hit/miss/eviction metrics of the shared album art cache"""
+        return self.cover_art_cache.get_stats()
 
     def draw_cover_flow(self, screen):
         """Draw iPod Classic 6th generation Cover Flow interface"""
@@ -146,96 +435,86 @@ class CoverFlow:
         # Cover Flow parameters
         focused_size = (90, 90)    # Size of the center album
         side_size = (60, 60)       # Size of side albums
-        num_side_covers = 2        # Number of covers on each side
+        num_side_covers = self.num_side_covers
 
-        # Calculate animation offset if animation is active
-        animation_offset = 0.0
-        if self.cover_flow_animation_active:
-            # Use easing function for smooth animation
-            eased_progress = self.ease_in_out_cubic(self.cover_flow_animation_progress)
-            if self.cover_flow_animation_direction == "left":
-                animation_offset = eased_progress * 120  # Spacing between covers
-            elif self.cover_flow_animation_direction == "right":
-                animation_offset = -eased_progress * 120
+        # Covers only request full-quality decodes once the view has settled
+        moving = self.cover_flow_animation_active or self.scrubbing
+        position = self.cover_flow_position
 
         # Draw covers with 3D perspective effect
-        for i in range(-num_side_covers, num_side_covers + 1):
-            album_index = self.current_cover_flow_index + i
+        visible_cover_keys = set()
+        first_index = max(0, math.floor(position) - num_side_covers)
+        last_index = min(len(self.cover_flow_albums) - 1, math.ceil(position) + num_side_covers)
+        for album_index in range(first_index, last_index + 1):
+            offset = album_index - position  # Distance from the center, fractional while moving
+            i = math.floor(offset + 0.5)  # Slot (size, angle, fade) the cover is closest to
+            if abs(i) > num_side_covers:
+                continue
+            album_data = self.cover_flow_albums[album_index]
+            album_name = album_data["name"]
+            cover_key = self._album_art_source(album_data)[0]
+            visible_cover_keys.add(cover_key)
             
-            # During animation, show transitioning covers
-            if self.cover_flow_animation_active:
-                if self.cover_flow_animation_direction == "left":
-                    album_index = self.current_cover_flow_index + i + (1 if self.cover_flow_animation_progress > 0.5 else 0)
-                elif self.cover_flow_animation_direction == "right":
-                    album_index = self.current_cover_flow_index + i - (1 if self.cover_flow_animation_progress > 0.5 else 0)
+            is_focused = (i == 0)
             
-            if 0 <= album_index < len(self.cover_flow_albums):
-                album_data = self.cover_flow_albums[album_index]
-                album_name = album_data["name"]
-                
-                is_focused = (i == 0)
-                
-                # Determine cover size and position
-                if is_focused:
-                    cover_size = focused_size
-                    scale_factor = 1.0
-                    rotation_angle = 0
-                    cover_y = center_y - cover_size[1] // 2
-                    alpha = 255
-                else:
-                    cover_size = side_size
-                    scale_factor = 0.7 + 0.3 * (1 - abs(i) * 0.2)  # Gradually smaller
-                    rotation_angle = i * 25  # Angle for 3D effect
-                    cover_y = center_y - cover_size[1] // 2 + 10  # Slightly lower
-                    alpha = max(80, 255 - abs(i) * 60)  # Fade out side covers
-
-                # Calculate X position with animation offset
-                base_spacing = 70
-                cover_x = center_x + (i * base_spacing) + animation_offset - cover_size[0] // 2
-
-                # Get album art
-                art_surface = self.get_album_art(album_name, album_data.get("art_path"), cover_size, album_data.get("song_path"))
-                
-                # Apply 3D perspective transformations
-                if not is_focused:
-                    # Scale the cover for perspective
-                    scaled_size = (int(cover_size[0] * scale_factor), int(cover_size[1] * scale_factor))
-                    if scaled_size[0] > 0 and scaled_size[1] > 0:
-                        art_surface = pygame.transform.smoothscale(art_surface, scaled_size)
-
-                    # Apply rotation for 3D effect
-                    if abs(rotation_angle) > 0:
-                        try:
-                            # Apply more pronounced rotation for iPod Classic effect
-                            rotated_surface = pygame.transform.rotate(art_surface, rotation_angle)
-                            art_surface = rotated_surface
-                        except:
-                            pass  # Fallback to non-rotated if rotation fails
-
-                    # Apply alpha for depth
-                    if alpha < 255:
-                        alpha_surface = pygame.Surface(art_surface.get_size(), pygame.SRCALPHA)
-                        alpha_surface.set_alpha(alpha)
-                        alpha_surface.blit(art_surface, (0, 0))
-                        art_surface = alpha_surface
-
-                # Final position adjustment for rotated/scaled surfaces
-                art_rect = art_surface.get_rect()
-                final_x = cover_x - (art_rect.width - cover_size[0]) // 2
-                final_y = cover_y - (art_rect.height - cover_size[1]) // 2
-
-                # Draw the cover
-                screen.blit(art_surface, (final_x, final_y))
-                
-                # Draw reflection for focused cover
-                if is_focused and not self.cover_flow_animation_active:
-                    self._draw_cover_reflection(screen, art_surface, final_x, final_y + art_rect.height)
+            # Determine cover size and position
+            if is_focused:
+                cover_size = focused_size
+                scale_factor = 1.0
+                rotation_angle = 0
+                cover_y = center_y - cover_size[1] // 2
+                alpha = 255
+            else:
+                cover_size = side_size
+                scale_factor = 0.7 + 0.3 * (1 - abs(i) * 0.2)  # Gradually smaller
+                rotation_angle = i * 25  # Angle for 3D effect
+                cover_y = center_y - cover_size[1] // 2 + 10  # Slightly lower
+                alpha = max(80, 255 - abs(i) * 60)  # Fade out side covers
+
+            # Calculate X position from the (possibly fractional) distance to the center
+            base_spacing = 70
+            cover_x = center_x + int(offset * base_spacing) - cover_size[0] // 2
+
+            # Get album art (cached thumbnails or placeholders only while moving)
+            get_art = self.get_album_art_preview if moving else self.get_album_art
+            art_surface = get_art(album_name, album_data.get("art_path"), cover_size,
+                                  album_data.get("song_path"), album_data.get("artwork_id"))
+            
+            # Apply 3D perspective transformations (cached per cover and slot)
+            if not is_focused:
+                art_surface = self._get_side_cover_surface(cover_key, i, art_surface, cover_size,
+                                                           scale_factor, rotation_angle, alpha)
+
+            # Final position adjustment for rotated/scaled surfaces
+            art_rect = art_surface.get_rect()
+            final_x = cover_x - (art_rect.width - cover_size[0]) // 2
+            final_y = cover_y - (art_rect.height - cover_size[1]) // 2
+
+            # Draw the cover
+            screen.blit(art_surface, (final_x, final_y))
+            
+            # Draw reflection for focused cover
+            if is_focused and not moving:
+                self._draw_cover_reflection(screen, art_surface, final_x, final_y + art_rect.height, cover_key)
+
+        # Purge transformed covers that left the window
+        for cover_key, slot in list(self._side_cover_cache):
+            if cover_key not in visible_cover_keys:
+                del self._side_cover_cache[(cover_key, slot)]
+        for cover_key in list(self._reflection_cache):
+            if cover_key not in visible_cover_keys:
+                del self._reflection_cache[cover_key]
+        for cover_key, size in list(self._preview_cache):
+            if cover_key not in visible_cover_keys:
+                del self._preview_cache[(cover_key, size)]
 
         # Draw album name for focused cover
         if not self.cover_flow_animation_active and self.cover_flow_albums:
             current_album = self.cover_flow_albums[self.current_cover_flow_index]
             album_name = current_album["name"]
-            name_surface = self.config.font_menu_item.render(album_name[:25], True, (255, 255, 255))
+            # Entre las flechas de navegación
+            album_name = self.config.fit_text(self.config.font_menu_item, album_name, self.config.SCREEN_WIDTH - 60)
+            name_surface = self.config.font_menu_item.render(album_name, True, (255, 255, 255))
             name_rect = name_surface.get_rect(centerx=center_x, y=center_y + focused_size[1] // 2 + 60)
             screen.blit(name_surface, name_rect)
 
@@ -258,79 +537,177 @@ class CoverFlow:
             counter_rect = counter_surface.get_rect(centerx=center_x, y=self.config.DISPLAY_HEIGHT - 35)
             screen.blit(counter_surface, counter_rect)
 
-    def _draw_cover_reflection(self, screen, surface, x, y):
-        """Draw a reflection effect for cover art"""
-        try:
-            reflection_height = int(surface.get_height() * 0.4)
-            if reflection_height > 0:
-                # Create flipped version
-                flipped = pygame.transform.flip(surface, False, True)
-                reflection = flipped.subsurface((0, 0, surface.get_width(), reflection_height))
-                
-                # Apply gradient alpha
-                alpha_surface = pygame.Surface(reflection.get_size(), pygame.SRCALPHA)
-                for y_alpha in range(reflection_height):
-                    alpha_value = max(10, 80 - int((y_alpha / reflection_height) * 70))
-                    pygame.draw.line(alpha_surface, (255, 255, 255, alpha_value), 
-                                   (0, y_alpha), (reflection.get_width(), y_alpha))
-                
-                reflection.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                screen.blit(reflection, (x, y + 2))  # Small gap
-        except:
-            pass  # Skip reflection if any error occurs
+    def _get_side_cover_surface(self, cover_key, slot, art_surface, cover_size, scale_factor, rotation_angle, alpha):
+        """Return the scaled, rotated and faded variant of a side cover, built once per cover and slot"""
+        entry = self._side_cover_cache.get((cover_key, slot))
+        if entry is not None and entry[0] is art_surface:
+            return entry[1]
+
+        # SRCALPHA staging copy from the shared pool (atlas slots are opaque subsurfaces)
+        surface_pool = self.config.surface_pool
+        staging = surface_pool.acquire(art_surface.get_size(), pygame.SRCALPHA)
+        staging.fill((0, 0, 0, 0))
+        staging.blit(art_surface, (0, 0))
+        # Scale the cover for perspective
+        scaled_size = (int(cover_size[0] * scale_factor), int(cover_size[1] * scale_factor))
+        if scaled_size[0] > 0 and scaled_size[1] > 0:
+            transformed = pygame.transform.smoothscale(staging, scaled_size)
+        else:
+            transformed = staging.copy()
+        surface_pool.release(staging)
+        # True perspective warp (precomputed column mapping), alpha baked in
+        warped = None
+        if abs(rotation_angle) > 0:
+            warped = perspective_warp(transformed, self.side_cover_angle, 1 if slot > 0 else -1, alpha)
+        if warped is not None:
+            transformed = warped
+        else:
+            # Fallback without NumPy: rotation for 3D effect
+            if abs(rotation_angle) > 0:
+                try:
+                    transformed = pygame.transform.rotate(transformed, rotation_angle)
+                except pygame.error:
+                    pass  # Fallback to non-rotated if rotation fails
+            # Bake alpha for depth into the pixels
+            if alpha < 255:
+                transformed.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+
+        # The source surface is kept so a placeholder swapped for real art invalidates the entry
+        self._side_cover_cache[(cover_key, slot)] = (art_surface, transformed)
+        return transformed
+
+    def _draw_cover_reflection(self, screen, surface, x, y, cover_key=None):
+        """Draw a reflection effect for cover art, built once per cover"""
+        entry = self._reflection_cache.get(cover_key)
+        if entry is None or entry[0] is not surface:
+            reflection = make_reflection(surface, getattr(self.config, 'reflection_height_ratio', 0.4))
+            entry = (surface, reflection)
+            self._reflection_cache[cover_key] = entry
+        if entry[1] is not None:
+            screen.blit(entry[1], (x, y + 2))  # Small gap
 
     def start_cover_flow_animation(self, direction):
-        """Start smooth animation for cover flow navigation"""
-        if self.cover_flow_animation_active:
-            return  # Don't start new animation while one is running
-        
+        """Start smooth animation for cover flow navigation (also while one is running)"""
+        if direction == "left":
+            return self.scrub(-1)
+        elif direction == "right":
+            return self.scrub(1)
+        return False
+
+    def scrub(self, steps):
+        """Move the target album by wheel/key steps; the faster the steps come, the more albums each one skips.
+        Returns True if the target changed."""
+        if not self.cover_flow_albums or steps == 0:
+            return False
+        self._update_scroll_velocity(1 if steps > 0 else -1)
+        step_size = 1
+        speed = abs(self.scroll_velocity)
+        if speed > self.scrub_velocity_threshold:
+            step_size = min(self.scrub_max_step, int((speed / self.scrub_velocity_threshold) ** 2))
+            self.scrubbing = True
+        target = self.cover_flow_target_index + steps * step_size
+        target = max(0, min(len(self.cover_flow_albums) - 1, target))
+        if target == self.cover_flow_target_index:
+            return False
+        self.cover_flow_target_index = target
         self.cover_flow_animation_active = True
-        self.cover_flow_animation_direction = direction
-        self.cover_flow_animation_progress = 0.0
-        
-        # Set target index
-        if direction == "left" and self.current_cover_flow_index > 0:
-            self.cover_flow_target_index = self.current_cover_flow_index - 1
-        elif direction == "right" and self.current_cover_flow_index < len(self.cover_flow_albums) - 1:
-            self.cover_flow_target_index = self.current_cover_flow_index + 1
+        return True
+
+    def _update_scroll_velocity(self, step):
+        """Estimate scrolling speed (covers per second) from the time between navigation steps"""
+        now = pygame.time.get_ticks() / 1000.0
+        if self._last_navigation_time is None or (now - self._last_navigation_time) > 1.0:
+            instant_velocity = step * 1.0
         else:
-            self.cover_flow_animation_active = False
+            instant_velocity = step / max(0.05, now - self._last_navigation_time)
+        if self.scroll_velocity * step > 0:
+            self.scroll_velocity = 0.5 * self.scroll_velocity + 0.5 * instant_velocity
+        else:
+            self.scroll_velocity = instant_velocity  # Direction reversed
+        self._last_navigation_time = now
 
-    def update_cover_flow_animation(self, dt):
-        """Update cover flow animation progress"""
-        if not self.cover_flow_animation_active:
+    def prefetch_neighbors(self):
+        """Queue background decodes for the covers ahead of the direction of travel"""
+        if self.art_loader is None or not self.cover_flow_albums:
             return
-        
-        # Update animation progress
-        self.cover_flow_animation_progress += self.cover_flow_animation_speed * dt
-        
-        if self.cover_flow_animation_progress >= 1.0:
-            # Animation complete
-            self.cover_flow_animation_progress = 1.0
-            self.cover_flow_animation_active = False
-            self.current_cover_flow_index = self.cover_flow_target_index
-            self.cover_flow_animation_direction = "none"
-
-    def ease_in_out_cubic(self, t):
-        """Smooth easing function for natural animation"""
-        if t < 0.5:
-            return 4 * t * t * t
+        if self.scrubbing:
+            # Las portadas que se saltan no se decodifican; cancelar lo que quedaba pendiente
+            for key in self._prefetch_keys:
+                if self.art_loader.cancel(key):
+                    self._pending_labels.pop(key, None)
+            self._prefetch_keys = set()
+            self._prefetch_signature = None
+            return
+        # Dejar de considerar la velocidad si el usuario ya no se mueve
+        if self._last_navigation_time is not None and not self.cover_flow_animation_active:
+            if pygame.time.get_ticks() / 1000.0 - self._last_navigation_time > 1.0:
+                self.scroll_velocity = 0.0
+
+        if self.cover_flow_animation_active:
+            anchor = self.cover_flow_target_index
+            direction = 1 if self.cover_flow_target_index > self.current_cover_flow_index else -1
         else:
-            return 1 - pow(-2 * t + 2, 3) / 2
+            anchor = self.current_cover_flow_index
+            direction = 1 if self.scroll_velocity > 0 else -1 if self.scroll_velocity < 0 else 0
+        count = min(self.prefetch_max_count,
+                    self.prefetch_base_count + int(abs(self.scroll_velocity) * self.prefetch_lookahead_s))
+        signature = (anchor, direction, count, len(self.cover_flow_albums))
+        if signature == self._prefetch_signature:
+            return
+        self._prefetch_signature = signature
+
+        first = self.num_side_covers + 1  # First cover outside the visible window
+        if direction == 0:
+            # Parado: precargar un poco a ambos lados
+            half = max(1, count // 2)
+            offsets = [o for k in range(first, first + half) for o in (k, -k)]
+        else:
+            offsets = [direction * k for k in range(first, first + count)]
+        wanted = []
+        for offset in offsets:
+            index = anchor + offset
+            if 0 <= index < len(self.cover_flow_albums):
+                album_data = self.cover_flow_albums[index]
+                wanted.append((album_data["name"],) + self._album_art_source(album_data))
+
+        # Cancelar peticiones obsoletas (p.ej. al invertir la dirección)
+        wanted_keys = set(source[1] for source in wanted)
+        for key in self._prefetch_keys - wanted_keys:
+            if self.art_loader.cancel(key):
+                self._pending_labels.pop(key, None)
+        self._prefetch_keys = wanted_keys
+
+        for album_name, cache_key, art_path, song_path, known_hash in wanted:
+            if (cache_key, (60, 60)) in self.cover_art_cache:  # Side cover size already decoded
+                continue
+            self._request_decode(cache_key, album_name, art_path, song_path, self._job_sizes(), known_hash)
+
+    def update_cover_flow_animation(self, dt):
+        """Update cover flow animation progress"""
+        if self.cover_flow_animation_active:
+            # Acercarse al objetivo de forma continua: rápido si está lejos, suave al llegar
+            distance = self.cover_flow_target_index - self.cover_flow_position
+            step = max(abs(distance) * min(1.0, self.cover_flow_animation_speed * dt),
+                       self.cover_flow_min_speed * dt)
+            if step >= abs(distance):
+                self.cover_flow_position = float(self.cover_flow_target_index)
+                self.cover_flow_animation_active = False
+            else:
+                self.cover_flow_position += math.copysign(step, distance)
+            self.current_cover_flow_index = math.floor(self.cover_flow_position + 0.5)
+        elif self.scrubbing and self._last_navigation_time is not None:
+            # The view settles once the wheel has been still for a moment
+            if pygame.time.get_ticks() / 1000.0 - self._last_navigation_time >= self.settle_delay_s:
+                self.scrubbing = False
+        self.prefetch_neighbors()
 
     def navigate_left(self):
         """Navigate left in Cover Flow"""
-        if self.current_cover_flow_index > 0:
-            self.start_cover_flow_animation("left")
-            return True
-        return False
+        return self.start_cover_flow_animation("left")
 
     def navigate_right(self):
         """Navigate right in Cover Flow"""
-        if self.current_cover_flow_index < len(self.cover_flow_albums) - 1:
-            self.start_cover_flow_animation("right")
-            return True
-        return False
+        return self.start_cover_flow_animation("right")
 
     def get_current_album(self):
         """Get the currently selected album name"""
@@ -1,7 +1,19 @@
 import sqlite3
+import os
 from pathlib import Path
 from mutagen import File
 import time
+from art_extractor import extract_embedded_art, hash_art, dominant_color, COLOR_ANALYSIS_AVAILABLE
+
+# Nombres de carátula de carpeta, en orden de preferencia
+FOLDER_ART_NAMES = (
+    'cover.jpg', 'cover.jpeg', 'cover.png',
+    'folder.jpg', 'folder.jpeg', 'folder.png',
+    'front.jpg', 'front.jpeg', 'front.png',
+    'album.jpg', 'album.jpeg', 'album.png',
+)
+NO_ARTWORK = 0  # artwork_id de canciones sin carátula (NULL = aún sin resolver)
+NO_COLOR = -1  # dominant_color de carátulas que no se pudieron analizar (NULL = pendiente)
 
 class MusicDatabase:
     def __init__(self, db_path="music_library.db"):
@@ -42,10 +54,56 @@ class MusicDatabase:
                 FOREIGN KEY (song_id) REFERENCES songs (id)
             )
         ''')
-        
+
+        # Carátula externa (cover.jpg, folder.png...) de cada carpeta con canciones
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS folder_art (
+                directory TEXT PRIMARY KEY,
+                art_path TEXT,
+                last_modified REAL
+            )
+        ''')
+
+        # Carátulas únicas por hash de contenido; las canciones y carpetas las referencian por id
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS artwork (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                art_hash TEXT UNIQUE NOT NULL,
+                source_path TEXT,
+                source_kind TEXT
+            )
+        ''')
+        self._ensure_column(cursor, 'songs', 'artwork_id', 'INTEGER')
+        self._ensure_column(cursor, 'folder_art', 'artwork_id', 'INTEGER')
+        self._ensure_column(cursor, 'folder_art', 'art_mtime', 'REAL')  # Stat of the art file itself:
+        self._ensure_column(cursor, 'folder_art', 'art_size', 'INTEGER')  # overwriting it keeps the dir mtime
+        self._ensure_column(cursor, 'artwork', 'dominant_color', 'INTEGER')  # 0xRRGGBB
+
+        # Índice de álbumes para Cover Flow: id = posición en orden alfabético (1..N),
+        # así una ventana de álbumes es un rango de ids sin recorrer toda la biblioteca
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS albums (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                song_path TEXT,
+                art_path TEXT,
+                artwork_id INTEGER
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_songs_album ON songs (album, path)')
+        cursor.execute('SELECT 1 FROM albums LIMIT 1')
+        if cursor.fetchone() is None:
+            self.rebuild_album_index(cursor)  # Bases de datos escaneadas antes de existir la tabla
+
         conn.commit()
         conn.close()
     
+    def _ensure_column(self, cursor, table, column, column_type):
+        """Añadir una columna a bases de datos creadas con un esquema anterior"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
     def scan_music_library(self, music_dirs=None):
         """Escanear y actualizar biblioteca de música """
         if music_dirs is None:
@@ -71,6 +129,8 @@ class MusicDatabase:
         print("Escaneando biblioteca de música...")
         songs_processed = 0
         songs_added_or_updated = 0
+        directories_seen = set()
+        changed_art_directories = set()
         
         for music_dir_path in music_dirs_paths:
             if not music_dir_path.exists() or not music_dir_path.is_dir():
@@ -81,23 +141,33 @@ class MusicDatabase:
             for file_path in music_dir_path.rglob("*"):
                 if file_path.suffix.lower() in supported_formats and file_path.is_file():
                     songs_processed += 1
+                    if file_path.parent not in directories_seen:
+                        directories_seen.add(file_path.parent)
+                        if self.index_folder_art(cursor, file_path.parent):
+                            changed_art_directories.add(file_path.parent)
                     try:
                         stat = file_path.stat()
                         cursor.execute(
-                            "SELECT last_modified FROM songs WHERE path = ?",
+                            "SELECT last_modified, artwork_id FROM songs WHERE path = ?",
                             (str(file_path),)
                         )
                         result = cursor.fetchone()
                         
                         if result and result[0] == stat.st_mtime:
-                            continue  # Archivo no modificado
+                            # Archivo no modificado: solo resolver la carátula si falta o cambió la carpeta
+                            if result[1] is None or file_path.parent in changed_art_directories:
+                                cursor.execute(
+                                    "UPDATE songs SET artwork_id = ? WHERE path = ?",
+                                    (self.resolve_artwork(cursor, file_path), str(file_path))
+                                )
+                            continue
                         
                         metadata = self.extract_metadata(file_path)
                         
                         cursor.execute('''
                             INSERT OR REPLACE INTO songs 
-                            (path, title, artist, album, duration, file_size, last_modified)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                            (path, title, artist, album, duration, file_size, last_modified, artwork_id)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                         ''', (
                             str(file_path),
                             metadata['title'],
@@ -105,7 +175,8 @@ class MusicDatabase:
                             metadata['album'],
                             metadata['duration'],
                             stat.st_size,
-                            stat.st_mtime
+                            stat.st_mtime,
+                            self.resolve_artwork(cursor, file_path)
                         ))
                         songs_added_or_updated +=1
                         
@@ -115,6 +186,8 @@ class MusicDatabase:
                     except Exception as e:
                         print(f"Error procesando {file_path}: {e}")
         
+        self.analyze_artwork_colors(cursor)
+        self.rebuild_album_index(cursor)
         conn.commit()
         conn.close()
         print(f"Escaneo completado. {songs_processed} archivos revisados, {songs_added_or_updated} canciones añadidas/actualizadas.")
@@ -123,6 +196,197 @@ class MusicDatabase:
         else:
             print("La biblioteca ya estaba al día.")
 
+    def index_folder_art(self, cursor, directory):
+        """Registrar la carátula de carpeta. Solo se vuelve a listar la carpeta si cambió el mtime del
+        directorio, y solo se vuelve a leer la imagen si cambiaron su mtime o su tamaño
+        (sobrescribir cover.jpg no cambia el mtime del directorio).
+        Devuelve True si la carpeta se ha (re)indexado."""
+        try:
+            dir_mtime = os.path.getmtime(directory)
+        except OSError:
+            return False
+        cursor.execute("SELECT last_modified, art_path, artwork_id, art_mtime, art_size FROM folder_art WHERE directory = ?",
+                       (str(directory),))
+        result = cursor.fetchone()
+        if result and result[0] == dir_mtime:
+            recorded_path, artwork_id, art_mtime, art_size = result[1:]
+            if not recorded_path:
+                return False  # Carpeta sin cambios y sin carátula
+            if artwork_id is not None and self._file_signature(recorded_path) == (art_mtime, art_size):
+                return False  # Carpeta y carátula sin cambios
+        art_path = self.find_folder_art(directory)
+        artwork_id = None
+        art_mtime, art_size = None, None
+        if art_path:
+            try:
+                art_mtime, art_size = self._file_signature(art_path) or (None, None)
+                with open(art_path, 'rb') as f:
+                    image_data = f.read()
+                artwork_id = self.add_artwork(cursor, hash_art(image_data), art_path, 'folder')
+            except OSError as e:
+                print(f"Error leyendo carátula {art_path}: {e}")
+        cursor.execute(
+            "INSERT OR REPLACE INTO folder_art (directory, art_path, last_modified, artwork_id, art_mtime, art_size) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (str(directory), str(art_path) if art_path else None, dir_mtime, artwork_id, art_mtime, art_size)
+        )
+        return True
+
+    def _file_signature(self, path):
+        """(mtime, size) de un fichero, None si ya no existe"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def add_artwork(self, cursor, art_hash, source_path, source_kind):
+        """Registrar una carátula por su hash (una sola fila por imagen) y devolver su id"""
+        cursor.execute("SELECT id FROM artwork WHERE art_hash = ?", (art_hash,))
+        result = cursor.fetchone()
+        if result:
+            # Misma imagen: solo actualizar desde dónde leerla
+            cursor.execute(
+                "UPDATE artwork SET source_path = ?, source_kind = ? WHERE id = ?",
+                (str(source_path), source_kind, result[0])
+            )
+            return result[0]
+        cursor.execute(
+            "INSERT INTO artwork (art_hash, source_path, source_kind) VALUES (?, ?, ?)",
+            (art_hash, str(source_path), source_kind)
+        )
+        return cursor.lastrowid
+
+    def analyze_artwork_colors(self, cursor):
+        """Calcular el color dominante de las carátulas nuevas (una vez por imagen, al escanear)"""
+        if not COLOR_ANALYSIS_AVAILABLE:
+            return  # Sin PIL se quedan pendientes hasta que esté disponible
+        cursor.execute("SELECT id, source_path, source_kind FROM artwork WHERE dominant_color IS NULL")
+        for artwork_id, source_path, source_kind in cursor.fetchall():
+            image_data = None
+            if source_kind == 'folder':
+                try:
+                    with open(source_path, 'rb') as f:
+                        image_data = f.read()
+                except OSError:
+                    pass
+            else:
+                embedded = extract_embedded_art(source_path)
+                if embedded is not None:
+                    image_data = embedded[0]
+            color = dominant_color(image_data) if image_data else None
+            packed = (color[0] << 16) | (color[1] << 8) | color[2] if color else NO_COLOR
+            cursor.execute("UPDATE artwork SET dominant_color = ? WHERE id = ?", (packed, artwork_id))
+
+    def rebuild_album_index(self, cursor):
+        """Regenerar la tabla albums (una fila por álbum, numeradas por orden alfabético)"""
+        cursor.execute('''
+            SELECT s.album, MIN(s.path),
+                   (SELECT a.artwork_id FROM songs a
+                    WHERE a.album = s.album AND a.artwork_id > 0
+                    ORDER BY a.path LIMIT 1)
+            FROM songs s
+            WHERE s.album IS NOT NULL AND s.album != ""
+            GROUP BY s.album
+            ORDER BY s.album
+        ''')
+        rows = cursor.fetchall()
+        cursor.execute("SELECT directory, art_path FROM folder_art WHERE art_path IS NOT NULL")
+        folder_art = dict(cursor.fetchall())
+        cursor.execute("DELETE FROM albums")
+        cursor.executemany(
+            "INSERT INTO albums (id, name, song_path, art_path, artwork_id) VALUES (?, ?, ?, ?, ?)",
+            [(position, album, song_path, folder_art.get(str(Path(song_path).parent)), artwork_id)
+             for position, (album, song_path, artwork_id) in enumerate(rows, start=1)]
+        )
+
+    def resolve_artwork(self, cursor, file_path):
+        """Carátula de una canción: la de su carpeta si existe, si no la embebida (NO_ARTWORK si no hay)"""
+        cursor.execute("SELECT artwork_id FROM folder_art WHERE directory = ?", (str(file_path.parent),))
+        result = cursor.fetchone()
+        if result and result[0]:
+            return result[0]
+        embedded = extract_embedded_art(file_path)
+        if embedded is None:
+            return NO_ARTWORK
+        _image_data, art_hash = embedded
+        return self.add_artwork(cursor, art_hash, file_path, 'embedded')
+
+    def find_folder_art(self, directory):
+        """Buscar la carátula de mayor preferencia en un directorio (sin distinguir mayúsculas)"""
+        try:
+            files = {name.lower(): name for name in os.listdir(directory)}
+        except OSError:
+            return None
+        for art_name in FOLDER_ART_NAMES:
+            if art_name in files:
+                return Path(directory) / files[art_name]
+        return None
+
+    def get_folder_art_path(self, directory):
+        """Obtener la carátula de carpeta indexada para un directorio, o None"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT art_path FROM folder_art WHERE directory = ?', (str(directory),))
+        result = cursor.fetchone()
+        conn.close()
+        return result[0] if result else None
+
+    def get_artwork(self, artwork_id):
+        """Obtener (art_hash, source_path, source_kind, color dominante (r, g, b) o None) de una carátula, o None"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT art_hash, source_path, source_kind, dominant_color FROM artwork WHERE id = ?', (artwork_id,))
+        artwork = cursor.fetchone()
+        conn.close()
+        if artwork is None:
+            return None
+        return self._artwork_info(*artwork)
+
+    def _artwork_info(self, art_hash, source_path, source_kind, packed):
+        """(art_hash, source_path, source_kind, color) con el color dominante desempaquetado"""
+        color = None
+        if packed is not None and packed >= 0:
+            color = ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+        return art_hash, source_path, source_kind, color
+
+    def get_album_count(self):
+        """Obtener el número de álbumes indexados (sin recorrer la tabla songs)"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT MAX(id) FROM albums')
+        result = cursor.fetchone()
+        conn.close()
+        return result[0] or 0
+
+    def get_album_window(self, start, count):
+        """Obtener los álbumes [start, start + count) en orden alfabético como
+        (name, song_path, art_path, artwork_id, artwork). artwork es la fila de get_artwork
+        (o None), leída en la misma consulta para no consultar la base de datos por álbum."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT albums.name, albums.song_path, albums.art_path, albums.artwork_id,
+                   artwork.art_hash, artwork.source_path, artwork.source_kind, artwork.dominant_color
+            FROM albums
+            LEFT JOIN artwork ON artwork.id = albums.artwork_id
+            WHERE albums.id > ? AND albums.id <= ?
+            ORDER BY albums.id
+        ''', (start, start + count))
+        albums = [row[:4] + (self._artwork_info(*row[4:]) if row[4] is not None else None,)
+                  for row in cursor.fetchall()]
+        conn.close()
+        return albums
+
+    def get_song_artwork_id(self, song_id):
+        """Obtener el artwork_id de una canción (None si no tiene carátula)"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT artwork_id FROM songs WHERE id = ?', (song_id,))
+        result = cursor.fetchone()
+        conn.close()
+        return result[0] if result and result[0] else None
+
     def extract_metadata(self, file_path_obj):
         """Extraer metadatos de archivo de audio """
         file_path = str(file_path_obj)
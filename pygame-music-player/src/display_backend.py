@@ -0,0 +1,78 @@
+"""
+Display backend module for iPod Classic interface.
+Presents the composed iPod screen and Click Wheel in the window, either
+with software blits + display.flip or through pygame's SDL2
+Renderer/Texture API (GPU composition when the driver has it).
+"""
+import pygame
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:
+    Window = None
+    Renderer = None
+    Texture = None
+
+
+class SoftwareDisplay:
+    """display.set_mode window: both parts are blitted and the window flipped"""
+
+    name = "software"
+
+    def __init__(self, size, caption):
+        self.size = tuple(size)
+        self.screen = pygame.display.set_mode(self.size)
+        pygame.display.set_caption(caption)
+        self.uploads = 0  # Same counters as SDL2Display, for the benchmarks
+
+    def present(self, display_surface, wheel_surface, wheel_y, wheel_changed=True):
+        """Show display_surface at the top and wheel_surface at wheel_y"""
+        self.screen.blit(display_surface, (0, 0))
+        self.screen.blit(wheel_surface, (0, wheel_y))
+        pygame.display.flip()
+
+
+class SDL2Display:
+    """SDL2 Renderer window: the Click Wheel is a static texture re-uploaded only when it changes,
+    the screen is a streaming texture updated once per frame and both are composed by the renderer"""
+
+    name = "sdl2"
+
+    def __init__(self, size, caption, driver_index=-1, vsync=False):
+        if Renderer is None:
+            raise RuntimeError("pygame._sdl2.video no está disponible")
+        self.size = tuple(size)
+        self.window = Window(caption, size=self.size)
+        self.renderer = Renderer(self.window, index=driver_index, accelerated=-1, vsync=vsync)
+        self.screen = None  # There is no display surface: everything goes through textures
+        self._screen_texture = None
+        self._wheel_texture = None
+        self.uploads = 0
+
+    def present(self, display_surface, wheel_surface, wheel_y, wheel_changed=True):
+        """Upload what changed and compose both textures"""
+        self._screen_texture = self._upload(self._screen_texture, display_surface, streaming=True)
+        if wheel_changed or self._wheel_texture is None:
+            self._wheel_texture = self._upload(self._wheel_texture, wheel_surface, streaming=False)
+        self.renderer.clear()
+        self._screen_texture.draw(dstrect=(0, 0) + display_surface.get_size())
+        self._wheel_texture.draw(dstrect=(0, wheel_y) + wheel_surface.get_size())
+        self.renderer.present()
+
+    def _upload(self, texture, surface, streaming):
+        self.uploads += 1
+        if texture is None or (texture.width, texture.height) != surface.get_size():
+            texture = Texture(self.renderer, surface.get_size(), streaming=streaming)
+            if surface.get_flags() & pygame.SRCALPHA:
+                texture.blend_mode = 1  # SDL_BLENDMODE_BLEND
+        texture.update(surface)
+        return texture
+
+
+def create_display(size, caption, backend="software"):
+    """Create the configured display backend, falling back to software if SDL2 rendering fails"""
+    if backend == "sdl2":
+        try:
+            return SDL2Display(size, caption)
+        except Exception as e:
+            print(f"Backend SDL2 no disponible ({e}); usando renderizado por software.")
+    return SoftwareDisplay(size, caption)
@@ -0,0 +1,47 @@
+"""
+List scroller module for iPod Classic interface.
+Eases a menu list's scroll position and selection bar towards the rows
+chosen by the navigation code, so lists glide pixel by pixel instead of
+jumping a whole row per click.
+"""
+import pygame
+import math
+
+
+class ListScroller:
+    """Smoothed scroll position and selection bar position of the visible list, in content pixels"""
+
+    def __init__(self, speed=18.0, min_speed=240.0):
+        self.speed = speed  # Fraction of the remaining distance covered per second
+        self.min_speed = min_speed  # Pixels per second, so the last pixels don't crawl
+        self.list_key = None
+        self.scroll = 0.0
+        self.bar = 0.0
+        self.moving = False
+        self._last_time = None
+
+    def update(self, list_key, scroll_target, bar_target, snap_distance):
+        """Advance towards the targets and return (scroll, bar).
+        A different list_key (another menu) or a jump longer than snap_distance is not animated."""
+        now = pygame.time.get_ticks() / 1000.0
+        if list_key != self.list_key:
+            self.list_key = list_key
+            self.scroll = float(scroll_target)
+            self.bar = float(bar_target)
+            self.moving = False
+        else:
+            dt = min(0.1, now - self._last_time)
+            self.scroll = self._approach(self.scroll, scroll_target, dt, snap_distance)
+            self.bar = self._approach(self.bar, bar_target, dt, snap_distance)
+            self.moving = self.scroll != scroll_target or self.bar != bar_target
+        self._last_time = now
+        return self.scroll, self.bar
+
+    def _approach(self, value, target, dt, snap_distance):
+        distance = target - value
+        if abs(distance) > snap_distance:
+            return float(target)  # P.ej. al pasar del último elemento al primero
+        step = max(abs(distance) * min(1.0, self.speed * dt), self.min_speed * dt)
+        if step >= abs(distance):
+            return float(target)
+        return value + math.copysign(step, distance)
@@ -10,6 +10,9 @@ from menu_manager import MenuManager
 from renderer import iPodRenderer
 from video_player import VideoPlayer
 from cover_flow import CoverFlow
+from menu_transition import MenuTransition
+from display_backend import create_display
+from thumbnail_store import ThumbnailStore
 from input_handler import InputHandler
 from music_controller import MusicController
 from wifi_manager import WiFiManager
@@ -35,9 +38,9 @@ class iPodClassicUI:
         self.selected_font = "Helvetica"
         self.ui_config = UIConfig()
         
-        # Set up display with new size
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.WINDOW_HEIGHT))
-        pygame.display.set_caption("iPod Classic")
+        # Set up display with new size (software blits or SDL2 renderer, see display_backend)
+        self.display = create_display((self.SCREEN_WIDTH, self.WINDOW_HEIGHT), "iPod Classic",
+                                      getattr(self.ui_config, "display_backend", "software"))
         
         # Superficie para la pantalla principal (usa la altura de pantalla, no la total)
         self.display_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
@@ -47,9 +50,12 @@ class iPodClassicUI:
         self.db = MusicDatabase(db_path="./ipod_music_library.db")
         self.playback = PlaybackManager(volume_change_callback=self.on_volume_changed)
         # Initialize modular components
-        self.renderer = iPodRenderer(self.screen, self.ui_config)
+        self.renderer = iPodRenderer(self.display_surface, self.ui_config)
         self.video_player = VideoPlayer(self.ui_config)
-        self.cover_flow = CoverFlow(self.ui_config, self.db)
+        self.thumbnail_store = ThumbnailStore(Path(__file__).parent.parent / "cache" / "thumbnails")
+        self.cover_flow = CoverFlow(self.ui_config, self.db, thumbnail_store=self.thumbnail_store)
+        # Now Playing and the album carousel share Cover Flow's art cache
+        self.renderer.cover_flow = self.cover_flow
         self.input_handler = InputHandler(self.ui_config)
         self.music_controller = MusicController(self.db, self.playback)
         self.wifi_manager = WiFiManager()
@@ -69,6 +75,12 @@ class iPodClassicUI:
         self.selected_index = 0
         self.scroll_offset = 0
         self.current_song_data = None
+        # Menu slide transitions
+        self.menu_transition = MenuTransition((self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
+                                              getattr(self.ui_config, "menu_transition_duration", 0.25))
+        self._drawn_menu = self.current_menu
+        self._drawn_depth = 0
+        self._drawn_wheel_state = False  # Never equal to a real state: the first frame draws the wheel
           # Settings state
         self.volume_control_active = False
         # WiFi state
@@ -109,8 +121,9 @@ class iPodClassicUI:
     def refresh_music_library(self, show_message=True):
         """Refresh the music library"""
         if show_message:
+            self.renderer.screen = self.display_surface
             self.renderer.draw_message_screen("Actualizando biblioteca...", "Por favor espere.")
-            pygame.display.flip()
+            self._present()
             pygame.time.wait(100)
         
         # Define music directories to scan
@@ -653,6 +666,9 @@ class iPodClassicUI:
             # Handle input
             self.handle_input()
             
+            # Swap in album art decoded by the background workers
+            self.cover_flow.process_art_results()
+            
             # Update animations
             dt = self.clock.get_time() / 1000.0
             if self.current_menu == "cover_flow":
@@ -671,72 +687,106 @@ class iPodClassicUI:
                 self.youtube_player.update_playback_position(dt)
             
             # --- RENDER PANTALLA ---
-            self.display_surface.fill(self.ui_config.BG_COLOR)
-            self.renderer.screen = self.display_surface
-            self.renderer.draw_background()
-            self.renderer.draw_header(self.current_menu, self.playback.is_playing and not self.playback.is_paused)
-            
-            if self.current_menu == "now_playing":
-                self.renderer.draw_now_playing(self.current_song_data,
-                                              self.playback.get_current_position_s(),
-                                              self.playback.is_playing,
-                                              self.playback.is_paused,
-                                              self.music_controller.get_playlist_info())
-            elif self.current_menu == "video_playing":
-                self.video_player.draw_video_playing(self.display_surface, self.renderer)
-            elif self.current_menu == "youtube_playing":
-                self.youtube_player.draw_youtube_video_playing(self.display_surface, self.renderer)
-            elif self.current_menu == "settings":
-                items = self.menu_manager.get_current_items()
-                self.renderer.draw_settings_menu(items, self.selected_index, self.scroll_offset)
-            elif self.current_menu == "cover_flow":
-                self.cover_flow.draw_cover_flow(self.display_surface)
-            else:
-                items = self.menu_manager.get_current_items()
-                menu_type = self.menu_manager.get_current_list_type()
-                # Menús donde se debe mostrar la mitad de portadas
-                if self.current_menu in ["main", "albums", "artists", "music"]:
-                    # Obtener lista de álbumes si aplica
-                    albums = None
-                    if self.current_menu == "albums":
-                        albums = self.menu_manager.get_current_items()
-                    self.renderer.draw_menu_with_album_art(
-                        items,
-                        self.selected_index,
-                        self.scroll_offset,
-                        menu_type,
-                        cover_flow=self.cover_flow,
-                        albums=albums
-                    )
-                else:
-                    self.renderer.draw_menu(items, self.selected_index, self.scroll_offset, menu_type)
+            self._update_menu_transition()
+            # Durante la transición solo se mueven las dos capturas
+            if not (self.menu_transition.active and self.menu_transition.draw(self.display_surface)):
+                self._draw_screen()
             
-            if self.current_menu != "now_playing" and self.current_song_data:
-                self.renderer.draw_mini_player(self.current_song_data,
-                                              self.playback.get_current_position_s(),
-                                              self.current_song_data[5],
-                                              self.playback.is_playing,
-                                              self.playback.is_paused)
-            
-            # --- RENDER CLICK WHEEL ---
-            self.click_wheel_surface.fill((0,0,0,0))  # Limpiar con transparencia
-            if self.click_wheel_enabled:
-                self.click_wheel.draw(self.click_wheel_surface)
-              # --- BLITTEAR AMBAS PARTES EN LA VENTANA PRINCIPAL ---
-            self.screen.blit(self.display_surface, (0, 0))
-            self.screen.blit(self.click_wheel_surface, (0, self.SCREEN_HEIGHT))
-            pygame.display.flip()
-            self.clock.tick(30)  # 30 FPS
+            # --- RENDER CLICK WHEEL Y PRESENTAR ---
+            self._present()
+            # 30 FPS en reposo; más solo mientras una lista o Cover Flow se desplaza
+            moving = (self.renderer.is_animating() or self.menu_transition.active or
+                      (self.current_menu == "cover_flow" and self.cover_flow.cover_flow_animation_active))
+            self.clock.tick(self.ui_config.fps_animating if moving else self.ui_config.fps_idle)
         
         # Cleanup
         self.cleanup()
     
+    def _present(self):
+        """Show the iPod screen and the Click Wheel (redrawn only when its look changed)"""
+        wheel_state = self.click_wheel.get_visual_state() if self.click_wheel_enabled else None
+        wheel_changed = wheel_state != self._drawn_wheel_state
+        if wheel_changed:
+            self.click_wheel_surface.fill((0,0,0,0))  # Limpiar con transparencia
+            if self.click_wheel_enabled:
+                self.click_wheel.draw(self.click_wheel_surface)
+            self._drawn_wheel_state = wheel_state
+        self.display.present(self.display_surface, self.click_wheel_surface, self.SCREEN_HEIGHT, wheel_changed)
+
+    def _update_menu_transition(self):
+        """Start a slide when the menu changed since the last frame.
+        The new menu is loaded by then, so it is drawn once into the incoming snapshot."""
+        previous_menu, previous_depth = self._drawn_menu, self._drawn_depth
+        self._drawn_menu, self._drawn_depth = self.current_menu, len(self.menu_stack)
+        if not getattr(self.ui_config, "menu_transitions", True) or previous_menu == self.current_menu:
+            return
+        # Los vídeos a pantalla completa no se deslizan
+        if {previous_menu, self.current_menu} & {"video_playing", "youtube_playing"}:
+            self.menu_transition.active = False
+            return
+        direction = -1 if len(self.menu_stack) < previous_depth else 1
+        self.menu_transition.start(self.display_surface, direction)  # Aún contiene el último frame
+        self._draw_screen()
+        self.menu_transition.capture_incoming(self.display_surface)
+
+    def _draw_screen(self):
+        """Draw the iPod screen (header, current menu, mini player) into display_surface"""
+        self.display_surface.fill(self.ui_config.BG_COLOR)
+        self.renderer.screen = self.display_surface
+        self.renderer.draw_background()
+        # Menús donde se debe mostrar la mitad de portadas (con cabecera "iPod")
+        split_view = self.current_menu in ["main", "albums", "artists", "music"]
+        header_title = "iPod" if split_view else self.current_menu
+        self.renderer.draw_header(header_title, self.playback.is_playing and not self.playback.is_paused)
+        
+        if self.current_menu == "now_playing":
+            self.renderer.draw_now_playing(self.current_song_data,
+                                          self.playback.get_current_position_s(),
+                                          self.playback.is_playing,
+                                          self.playback.is_paused,
+                                          self.music_controller.get_playlist_info())
+        elif self.current_menu == "video_playing":
+            self.video_player.draw_video_playing(self.display_surface, self.renderer)
+        elif self.current_menu == "youtube_playing":
+            self.youtube_player.draw_youtube_video_playing(self.display_surface, self.renderer)
+        elif self.current_menu == "settings":
+            items = self.menu_manager.get_current_items()
+            self.renderer.draw_settings_menu(items, self.selected_index, self.scroll_offset)
+        elif self.current_menu == "cover_flow":
+            self.cover_flow.draw_cover_flow(self.display_surface)
+        else:
+            items = self.menu_manager.get_current_items()
+            menu_type = self.menu_manager.get_current_list_type()
+            if split_view:
+                # Obtener lista de álbumes si aplica
+                albums = None
+                if self.current_menu == "albums":
+                    albums = self.menu_manager.get_current_items()
+                self.renderer.draw_menu_with_album_art(
+                    items,
+                    self.selected_index,
+                    self.scroll_offset,
+                    menu_type,
+                    cover_flow=self.cover_flow,
+                    albums=albums
+                )
+            else:
+                self.renderer.draw_menu(items, self.selected_index, self.scroll_offset, menu_type)
+        
+        if self.current_menu != "now_playing" and self.current_song_data:
+            self.renderer.draw_mini_player(self.current_song_data,
+                                          self.playback.get_current_position_s(),
+                                          self.current_song_data[5],
+                                          self.playback.is_playing,
+                                          self.playback.is_paused)
+
     def cleanup(self):
         """Clean up resources before exit"""
         if hasattr(self.video_player, 'stop_video'):
             self.video_player.stop_video()
         if hasattr(self.youtube_player, 'stop_video'):
             self.youtube_player.stop_video()
+        self.cover_flow.shutdown()
         pygame.quit()
     
     def _handle_click_wheel_actions(self, actions):
@@ -744,7 +794,10 @@ class iPodClassicUI:
         for action in actions:
             action_type = action.get("type")
             
-            if action_type == "scroll_up":
+            if action_type in ("scroll_up", "scroll_down") and self.current_menu == "cover_flow":
+                # La rueda recorre Cover Flow; girarla rápido salta varios álbumes por paso
+                self.cover_flow.scrub(-1 if action_type == "scroll_up" else 1)
+            elif action_type == "scroll_up":
                 self.move_selection(-1)
             elif action_type == "scroll_down":
                 self.move_selection(1)
@@ -0,0 +1,64 @@
+"""
+Marquee module for iPod Classic interface.
+Scrolls a title that does not fit its space, like the iPod does. The
+full string is rendered once into a strip surface; each frame only moves
+a clipped blit window over it.
+"""
+import pygame
+
+
+class Marquee:
+    """Looping text strip with a pause at the start of every pass"""
+
+    def __init__(self, speed=30.0, pause=1.5, gap=40):
+        self.speed = speed  # Pixels per second
+        self.pause = pause  # Seconds the start of the text stays still before each pass
+        self.gap = gap  # Pixels between the end of the text and its repetition
+        self.key = None  # (font, text, color, width) the strip was rendered for
+        self.strip = None
+        self.text_width = 0
+        self.width = 0
+        self.start_time = 0.0
+        self.renders = 0
+
+    def set_text(self, font, text, color, width):
+        """Render the strip when the text changes (restarting the pass); no-op otherwise"""
+        key = (font, text, tuple(color), int(width))
+        if key == self.key:
+            return
+        self.key = key
+        self.width = int(width)
+        text_surf = font.render(text, True, color)
+        self.text_width = text_surf.get_width()
+        if self.text_width <= self.width:
+            self.strip = text_surf
+        else:
+            # Texto + hueco + texto: la ventana puede recorrerlo sin saltos al dar la vuelta
+            self.strip = pygame.Surface((self.text_width * 2 + self.gap, text_surf.get_height()), pygame.SRCALPHA)
+            self.strip.blit(text_surf, (0, 0))
+            self.strip.blit(text_surf, (self.text_width + self.gap, 0))
+        self.start_time = pygame.time.get_ticks() / 1000.0
+        self.renders += 1
+
+    def restart(self):
+        """Go back to the start of the text (e.g. when the row is selected again)"""
+        self.start_time = pygame.time.get_ticks() / 1000.0
+
+    @property
+    def scrolling(self):
+        return self.strip is not None and self.text_width > self.width
+
+    def get_offset(self):
+        """Current x offset of the blit window inside the strip"""
+        if not self.scrolling:
+            return 0
+        cycle = self.text_width + self.gap
+        elapsed = (pygame.time.get_ticks() / 1000.0 - self.start_time) % (self.pause + cycle / self.speed)
+        return min(cycle, int(max(0.0, elapsed - self.pause) * self.speed))
+
+    def draw(self, surface, pos):
+        """Blit the visible window of the strip at pos and return the (dirty) rect it covers"""
+        if self.strip is None:
+            return pygame.Rect(pos, (0, 0))
+        area = pygame.Rect(self.get_offset(), 0, self.width, self.strip.get_height())
+        return surface.blit(self.strip, pos, area)
@@ -92,9 +92,7 @@ class MenuManager:
                 filename = Path(video_file).stem
                 self.current_list_items.append(
                     {
-                        "label": (
-                            filename[:30] + "..." if len(filename) > 30 else filename
-                        ),
+                        "label": filename,  # The renderer ellipsizes it to the row width
                         "action": "play_video",
                         "data": video_file,
                     }
@@ -213,10 +211,12 @@ class MenuManager:
     def load_albums_list(self):
         """Load list of albums from database"""
         self.current_menu = "albums"
-        albums = self.db.get_albums()
+        # Índice de álbumes: incluye la carátula de cada uno para el carrusel de portadas
+        albums = self.db.get_album_window(0, self.db.get_album_count())
         self.current_list_items = [
-            {"label": album, "action": "view_songs_by_album", "data": album}
-            for album in albums
+            {"label": album, "action": "view_songs_by_album", "data": album,
+             "song_path": song_path, "art_path": art_path, "artwork_id": artwork_id, "artwork": artwork}
+            for album, song_path, art_path, artwork_id, artwork in albums
         ]
         if not albums:
             self.current_list_items.append(
@@ -411,8 +411,8 @@ class MenuManager:
             "artists": "Artists",
             "albums": "Albums",
             "all_songs": "Songs",
-            "songs_by_artist": getattr(self, "current_artist_filter", "Artist")[:15],
-            "songs_by_album": getattr(self, "current_album_filter", "Album")[:15],
+            "songs_by_artist": getattr(self, "current_artist_filter", "Artist"),
+            "songs_by_album": getattr(self, "current_album_filter", "Album"),
             "now_playing": "Now Playing",
             "settings": "Settings",
             "cover_flow": "Cover Flow",
@@ -423,10 +423,8 @@ class MenuManager:
             "wifi_connecting": "Connecting",
         }
 
-        title = title_map.get(self.current_menu, "iPod")
-        if len(title) > 20:  # Truncate if too long for header
-            title = title[:18] + "..."
-        return title
+        # Full title: draw_header fits it to the header width in pixels
+        return title_map.get(self.current_menu, "iPod")
 
     def can_go_back(self):
         """Check if back navigation is possible"""
@@ -528,7 +526,7 @@ class MenuManager:
             self.current_list_items = []
             for video in results:
                 duration_text = f" ({video['duration']})" if video['duration'] else ""
-                title = video['title'][:35] + duration_text
+                title = video['title'] + duration_text  # The renderer ellipsizes it to the row width
                 subtitle = f"por {video['uploader']}"
                 self.current_list_items.append({
                     "label": title,
@@ -568,7 +566,7 @@ class MenuManager:
             self.current_list_items = []
             for i, video in enumerate(trending_videos, 1):
                 duration_text = f" ({video['duration']})" if video['duration'] else ""
-                title = f"{i}. {video['title'][:30]}" + duration_text
+                title = f"{i}. {video['title']}" + duration_text
                 subtitle = f"por {video['uploader']}"
                 self.current_list_items.append({
                     "label": title,
@@ -0,0 +1,45 @@
+"""
+Menu transition module for iPod Classic interface.
+Slides menus left/right on navigation like a real iPod. Both menus are
+snapshotted once when the transition starts; each frame only moves the
+two snapshots.
+"""
+import pygame
+
+
+class MenuTransition:
+    """Push/pop slide between two menu snapshots (two blits per frame)"""
+
+    def __init__(self, size, duration=0.25):
+        self.size = tuple(size)
+        self.duration = duration
+        self.outgoing = pygame.Surface(self.size)  # Persistent snapshot surfaces, reused by every transition
+        self.incoming = pygame.Surface(self.size)
+        self.direction = 1  # 1 = push (new menu enters from the right), -1 = pop
+        self.start_time = 0.0
+        self.active = False
+
+    def start(self, current_frame, direction):
+        """Snapshot the frame being left; the incoming one is captured with capture_incoming"""
+        self.outgoing.blit(current_frame, (0, 0))
+        self.direction = direction
+        self.start_time = pygame.time.get_ticks() / 1000.0
+        self.active = True
+
+    def capture_incoming(self, frame):
+        """Snapshot the first frame of the menu being entered"""
+        self.incoming.blit(frame, (0, 0))
+
+    def draw(self, target):
+        """Blit both snapshots at their current offsets. Returns False once the slide has finished."""
+        if not self.active:
+            return False
+        t = min(1.0, (pygame.time.get_ticks() / 1000.0 - self.start_time) / self.duration)
+        if t >= 1.0:
+            self.active = False
+            return False
+        eased = 1 - (1 - t) ** 3  # Ease-out: rápido al principio, suave al llegar
+        offset = int(eased * self.size[0]) * self.direction
+        target.blit(self.outgoing, (-offset, 0))
+        target.blit(self.incoming, (self.size[0] * self.direction - offset, 0))
+        return True
@@ -4,17 +4,201 @@ Handles all drawing operations and visual rendering.
 """
 import pygame
 import os
+import math
 from pathlib import Path
-import random
+from surface_effects import vertical_gradient
+from album_carousel import AlbumCarousel
+from row_cache import RowSurfaceCache
+from list_scroller import ListScroller
+from marquee import Marquee
 
 
 class iPodRenderer:
     """Handles all rendering operations for the iPod Classic UI"""
+
+    # Layout of each list style: label x, selection bar inset and corner radius,
+    # arrow margin (None = fixed x at width - 20)
+    ROW_STYLES = {
+        "menu": {"text_x": 12, "bar_inset": 3, "bar_radius": 6, "arrow_margin": 12},
+        "split": {"text_x": 12, "bar_inset": 3, "bar_radius": 6, "arrow_margin": 12},
+        "settings": {"text_x": 10, "bar_inset": 0, "bar_radius": 0, "arrow_margin": None},
+    }
+    TEXT_PADDING = 4  # Pixels kept free between a truncated label and what follows it
     
     def __init__(self, screen, config):
         self.screen = screen
         self.config = config
+        self._gradient_cache = {}  # (size, top, bottom, radius) -> surface
+        self._fonts = {}  # (size, bold) -> default pygame font, created once
+        self.row_cache = RowSurfaceCache(getattr(config, 'menu_row_cache_size', 96))
+        self.list_scroller = ListScroller(speed=getattr(config, 'list_scroll_speed', 18.0))
+        # Títulos largos: la fila seleccionada y el título de Now Playing se desplazan
+        self.marquee_enabled = getattr(config, 'marquee_enabled', True)
+        marquee_speed = getattr(config, 'marquee_speed', 30.0)
+        marquee_pause = getattr(config, 'marquee_pause', 1.5)
+        self.row_marquee = Marquee(speed=marquee_speed, pause=marquee_pause)
+        self.title_marquee = Marquee(speed=marquee_speed, pause=marquee_pause)
+        self._row_marquee_item = None  # (list key, index) whose label the row marquee shows
+        # Now Playing layers: static per track, progress/times per displayed second
+        self._now_playing_static = None
+        self._now_playing_static_key = None
+        self._now_playing_title_pos = None  # Where the scrolling title goes, None if it is baked in
+        self._now_playing_bg = config.BG_COLOR
+        self._now_playing_progress = None
+        self._now_playing_progress_rect = None
+        self._now_playing_progress_key = None
+        # Panel derecho de los menús divididos (portadas de álbumes)
+        menu_width = config.SCREEN_WIDTH // 2
+        self.album_carousel = AlbumCarousel(config, pygame.Rect(menu_width, 0, config.SCREEN_WIDTH - menu_width,
+                                                                config.DISPLAY_HEIGHT))
         
+    def get_gradient(self, size, top_color, bottom_color, border_radius=0):
+        """Get a cached vertical gradient surface (built once with NumPy)"""
+        key = (tuple(size), tuple(top_color), tuple(bottom_color), border_radius)
+        gradient = self._gradient_cache.get(key)
+        if gradient is None:
+            gradient = vertical_gradient(size, top_color, bottom_color, border_radius)
+            self._gradient_cache[key] = gradient
+        return gradient
+
+    def get_font(self, size, bold=False):
+        """Default pygame font of the given size, created once (fitted labels are memoized per font)"""
+        font = self._fonts.get((size, bold))
+        if font is None:
+            font = pygame.font.SysFont(None, size, bold=bold)
+            self._fonts[(size, bold)] = font
+        return font
+
+    def draw_selection_bar(self, surface, rect, border_radius=6):
+        """Draw the blue iPod selection gradient into rect"""
+        rect = pygame.Rect(rect)
+        gradient = self.get_gradient(rect.size,
+                                     self.config.MENU_ITEM_SELECTED_GRADIENT_TOP,
+                                     self.config.MENU_ITEM_SELECTED_GRADIENT_BOTTOM,
+                                     border_radius)
+        surface.blit(gradient, rect.topleft)
+
+    def is_animating(self):
+        """True while a list is still gliding towards its selection (the main loop raises the frame rate)"""
+        return self.list_scroller.moving
+
+    def draw_list(self, menu_items, selected_index, scroll_offset, area, style, show_sublabel=False):
+        """Draw the rows of a list that intersect area, with eased scrolling and selection bar.
+
+        scroll_offset/selected_index are the rows chosen by the navigation code; the list
+        glides towards them pixel by pixel. Only visible rows are blitted, from the row cache."""
+        item_height = self.config.item_height
+        layout = self.ROW_STYLES[style]
+        scroll_px, bar_px = self.list_scroller.update((style, id(menu_items), len(menu_items)),
+                                                      scroll_offset * item_height, selected_index * item_height,
+                                                      area.height)
+        scroll_px = int(round(scroll_px))
+        previous_clip = self.screen.get_clip()
+        self.screen.set_clip(area.clip(previous_clip))
+
+        # Barra de selección bajo las filas
+        if 0 <= selected_index < len(menu_items):
+            inset = layout["bar_inset"]
+            bar_y = area.y + int(round(bar_px)) - scroll_px
+            self.draw_selection_bar(self.screen, (area.x + inset, bar_y, area.width - 2 * inset, item_height),
+                                    border_radius=layout["bar_radius"])
+        highlighted_index = int(bar_px / item_height + 0.5)  # Row most covered by the bar gets the selected text
+
+        first_index = max(0, scroll_px // item_height)
+        last_index = min(len(menu_items), math.ceil((scroll_px + area.height) / item_height))
+        # Once the list settles, a selected label that doesn't fit scrolls instead of being ellipsized
+        marquee_index = None
+        if self.marquee_enabled and not self.list_scroller.moving and first_index <= highlighted_index < last_index:
+            if self._set_row_marquee(menu_items[highlighted_index], area.width, style,
+                                     (self.list_scroller.list_key, highlighted_index)):
+                marquee_index = highlighted_index
+        for index in range(first_index, last_index):
+            row = self.get_menu_row(menu_items[index], index == highlighted_index, area.width, style, show_sublabel,
+                                    hide_label=index == marquee_index)
+            row_y = area.y + index * item_height - scroll_px
+            self.screen.blit(row, (area.x, row_y))
+            if index == marquee_index:
+                label_x = area.x + layout["text_x"]
+                label_y = row_y + (item_height - self.row_marquee.strip.get_height()) // 2
+                self.row_marquee.draw(self.screen, (label_x, label_y))
+        self.screen.set_clip(previous_clip)
+        return scroll_px / item_height
+
+    def _set_row_marquee(self, item, width, style, item_key):
+        """Point the row marquee at the selected item's label. False if the label fits its row."""
+        label_text = item.get("label", "")
+        has_arrow = style == "settings" or item.get("action") != "none"
+        label_width = self._label_width(self.ROW_STYLES[style], width, has_arrow)
+        if self.config.fit_text(self.config.font_menu_item, label_text, label_width) == label_text:
+            return False
+        self.row_marquee.set_text(self.config.font_menu_item, label_text, self.config.MENU_ITEM_SELECTED_TEXT, label_width)
+        if item_key != self._row_marquee_item:
+            self._row_marquee_item = item_key
+            self.row_marquee.restart()
+        return True
+
+    def _label_width(self, layout, width, has_arrow):
+        """Pixels available to a row's label: up to the arrow when there is one"""
+        text_right = width
+        if has_arrow:
+            if layout["arrow_margin"] is None:
+                text_right = width - 20
+            else:
+                text_right = width - self.config.font_menu_item.size("›")[0] - layout["arrow_margin"]
+        return text_right - layout["text_x"] - self.TEXT_PADDING
+
+    def get_menu_row(self, item, is_selected, width, style, show_sublabel=False, hide_label=False):
+        """Return the rendered surface of one list row (text and arrow, the selection bar is drawn
+        separately), cached by label, selected state, width and fonts (Settings can switch them).
+        hide_label leaves the label out (the row marquee draws it)."""
+        label_text = "" if hide_label else item.get("label", "")
+        sub_label_text = item.get("sublabel", "") if show_sublabel and "sublabel" in item else None
+        has_arrow = is_selected and (style == "settings" or item.get("action") != "none")
+        key = (style, width, label_text, sub_label_text, has_arrow, is_selected,
+               self.config.font_menu_item, self.config.font_menu_item_small)
+        row = self.row_cache.get(key)
+        if row is None:
+            row = self._render_menu_row(self.ROW_STYLES[style], width, label_text, sub_label_text, has_arrow, is_selected)
+            self.row_cache.put(key, row)
+        return row
+
+    def _render_menu_row(self, layout, width, label_text, sub_label_text, has_arrow, is_selected):
+        """Render a list row's text on a transparent surface (taller than item_height if the sublabel overflows)"""
+        item_height = self.config.item_height
+        if is_selected:
+            text_color = self.config.MENU_ITEM_SELECTED_TEXT
+            sub_text_color = self.config.MENU_ITEM_SELECTED_TEXT
+        else:
+            text_color = self.config.MENU_ITEM_TEXT
+            sub_text_color = self.config.GRAY
+
+        arrow_surf = None
+        if has_arrow:
+            arrow_surf = self.config.font_menu_item.render("›", True, text_color)
+            if layout["arrow_margin"] is None:
+                arrow_x = width - 20
+            else:
+                arrow_x = width - arrow_surf.get_width() - layout["arrow_margin"]
+        label_width = self._label_width(layout, width, has_arrow)
+        label_text = self.config.fit_text(self.config.font_menu_item, label_text, label_width)
+        text_surf = self.config.font_menu_item.render(label_text, True, text_color)
+        sub_text_surf = None
+        sub_y = item_height // 2 + 4  # Sublabel below the main label
+        if sub_label_text is not None:
+            sub_label_text = self.config.fit_text(self.config.font_menu_item_small, sub_label_text, label_width - 3)
+            sub_text_surf = self.config.font_menu_item_small.render(sub_label_text, True, sub_text_color)
+
+        height = item_height
+        if sub_text_surf is not None:
+            height = max(height, sub_y + sub_text_surf.get_height())
+        row = pygame.Surface((width, height), pygame.SRCALPHA)
+        row.blit(text_surf, (layout["text_x"], (item_height - text_surf.get_height()) // 2))
+        if sub_text_surf is not None:
+            row.blit(sub_text_surf, (layout["text_x"] + 3, sub_y))
+        if arrow_surf is not None:
+            row.blit(arrow_surf, (arrow_x, (item_height - arrow_surf.get_height()) // 2))
+        return row
+
     def draw_background(self):
         """Draw iPod Classic white background"""
         self.screen.fill(self.config.BG_COLOR)
@@ -22,8 +206,10 @@ class iPodRenderer:
     def draw_header(self, title, is_playing=False, is_paused=False):
         """Draw iPod Classic header with status bar"""
         # Header background
-        pygame.draw.rect(self.screen, self.config.HEADER_BG, 
-                        (0, 0, self.config.SCREEN_WIDTH, self.config.header_height))
+        header_gradient = self.get_gradient((self.config.SCREEN_WIDTH, self.config.header_height),
+                                            self.config.HEADER_GRADIENT_TOP,
+                                            self.config.HEADER_GRADIENT_BOTTOM)
+        self.screen.blit(header_gradient, (0, 0))
         
         # Bottom border line
         pygame.draw.line(self.screen, self.config.HEADER_DIVIDER, 
@@ -31,6 +217,8 @@ class iPodRenderer:
                         (self.config.SCREEN_WIDTH, self.config.header_height-1))
         
         # Title text - centered
+        # Centrado entre el icono de reproducción y la batería
+        title = self.config.fit_text(self.config.font_header, title, self.config.SCREEN_WIDTH - 60)
         text_surface = self.config.font_header.render(title, True, self.config.HEADER_TEXT)
         text_rect = text_surface.get_rect(centerx=self.config.SCREEN_WIDTH / 2, 
                                         centery=self.config.header_height / 2)
@@ -60,61 +248,20 @@ class iPodRenderer:
     def draw_menu(self, menu_items, selected_index, scroll_offset, list_type=""):
         """Draw iPod Classic menu with proper styling"""
         y_offset = self.config.header_height + 3  # Start closer to header like real iPod
-        
-        for i in range(self.config.visible_items_limit):
-            current_item_index = scroll_offset + i
-            if current_item_index >= len(menu_items):
-                break
-
-            item = menu_items[current_item_index]
-            item_y_pos = y_offset + (i * self.config.item_height)
-            
-            is_selected = (current_item_index == selected_index)
-            
-            # iPod Classic selection highlight
-            if is_selected:
-                # Draw rounded selection rectangle like iPod
-                selection_rect = pygame.Rect(3, item_y_pos, self.config.SCREEN_WIDTH - 6, self.config.item_height)
-                pygame.draw.rect(self.screen, self.config.MENU_ITEM_SELECTED_BG, selection_rect, border_radius=6)
-                text_color = self.config.MENU_ITEM_SELECTED_TEXT
-                sub_text_color = self.config.MENU_ITEM_SELECTED_TEXT
-            else:
-                text_color = self.config.MENU_ITEM_TEXT
-                sub_text_color = self.config.GRAY
-
-            # Main menu item text with iPod spacing
-            label_text = item.get("label", "")
-            if len(label_text) > 30: 
-                label_text = label_text[:27] + "..."
-            text_surf = self.config.font_menu_item.render(label_text, True, text_color)
-            self.screen.blit(text_surf, (12, item_y_pos + (self.config.item_height - text_surf.get_height()) // 2))
-
-            # Sublabel for songs (artist name)
-            if "sublabel" in item and list_type == "songs":
-                sub_label_text = item.get("sublabel", "")
-                if len(sub_label_text) > 25:
-                    sub_label_text = sub_label_text[:22] + "..."
-                sub_text_surf = self.config.font_menu_item_small.render(sub_label_text, True, sub_text_color)
-                # Position sublabel below main label
-                sub_y = item_y_pos + (self.config.item_height // 2) + 4
-                self.screen.blit(sub_text_surf, (15, sub_y))
-            
-            # iPod Classic navigation arrow
-            if is_selected and item.get("action") != "none":
-                arrow_surf = self.config.font_menu_item.render("›", True, text_color)
-                arrow_x = self.config.SCREEN_WIDTH - arrow_surf.get_width() - 12
-                arrow_y = item_y_pos + (self.config.item_height - arrow_surf.get_height()) // 2
-                self.screen.blit(arrow_surf, (arrow_x, arrow_y))
+        list_area = pygame.Rect(0, y_offset, self.config.SCREEN_WIDTH,
+                                self.config.visible_items_limit * self.config.item_height)
+        # Filas cacheadas: solo se vuelven a renderizar las que cambian de estado
+        scroll_position = self.draw_list(menu_items, selected_index, scroll_offset, list_area, "menu", list_type == "songs")
 
         # iPod Classic scrollbar
         if len(menu_items) > self.config.visible_items_limit:
-            self.draw_scrollbar(menu_items, scroll_offset)
+            self.draw_scrollbar(menu_items, scroll_position)
 
-    def draw_scrollbar(self, menu_items, scroll_offset):
-        """Draw iPod Classic style scrollbar"""
+    def draw_scrollbar(self, menu_items, scroll_offset, list_width=None):
+        """Draw iPod Classic style scrollbar at the right edge of a list (scroll_offset may be fractional)"""
         list_height_pixels = self.config.visible_items_limit * self.config.item_height
         scrollbar_width = 4
-        scrollbar_x = self.config.SCREEN_WIDTH - scrollbar_width - 2
+        scrollbar_x = (list_width or self.config.SCREEN_WIDTH) - scrollbar_width - 2
         scrollbar_y = self.config.header_height + 3
         
         # Background
@@ -130,83 +277,144 @@ class iPodRenderer:
 
     def draw_now_playing(self, song_data, current_position, is_playing, is_paused, 
                         playlist_info=None):
-        """Draw the Now Playing screen (estilo iPod Classic real)"""
-        # --- HEADER ---
+        """Draw the Now Playing screen (estilo iPod Classic real).
+
+        Two cached layers: the static one (tint, header, cover, texts) is composed once per
+        track, the progress bar and times only when the displayed second changes."""
+        cover_flow = getattr(self, 'cover_flow', None)
+        # art_generation: a cover decoded in the background replaces the placeholder
+        static_key = (tuple(song_data) if song_data else None, cover_flow.art_generation if cover_flow else None,
+                      self.config.font_header, self.marquee_enabled)
+        if static_key != self._now_playing_static_key:
+            self._compose_now_playing_static(song_data, cover_flow)
+            self._now_playing_static_key = static_key
+            self._now_playing_progress_key = None
+        self.screen.blit(self._now_playing_static, (0, 0))
+        if not song_data:
+            return
+
+        if self._now_playing_title_pos is not None:
+            # Título largo: la marquesina se mueve sobre la capa estática
+            self.title_marquee.draw(self.screen, self._now_playing_title_pos)
+
+        duration_s = song_data[5]
+        remaining_key = int(duration_s - current_position) if duration_s > 0 else None
+        progress_key = (int(current_position), remaining_key, duration_s)
+        if progress_key != self._now_playing_progress_key:
+            self._compose_now_playing_progress(current_position, duration_s)
+            self._now_playing_progress_key = progress_key
+        self.screen.blit(self._now_playing_progress, self._now_playing_progress_rect)
+
+    def _compose_now_playing_static(self, song_data, cover_flow):
+        """Compose everything on the Now Playing screen that only changes with the track"""
+        if self._now_playing_static is None:
+            self._now_playing_static = pygame.Surface((self.config.SCREEN_WIDTH, self.config.DISPLAY_HEIGHT))
+        layer = self._now_playing_static
+        self._now_playing_title_pos = None
+
+        # --- FONDO TEÑIDO CON EL COLOR DE LA CARÁTULA (calculado al escanear) ---
         header_height = 24
-        pygame.draw.rect(self.screen, (0, 0, 0), (0, 0, self.config.SCREEN_WIDTH, header_height))
+        artwork_id = None
+        self._now_playing_bg = self.config.BG_COLOR
+        if song_data and cover_flow:
+            artwork_id = cover_flow.resolve_song_artwork(song_data[0])
+            art_color = cover_flow.get_artwork_color(artwork_id)
+            if art_color:
+                strength = self.config.NOW_PLAYING_TINT_STRENGTH
+                self._now_playing_bg = tuple(int(bg + (c - bg) * strength) for bg, c in zip(self.config.BG_COLOR, art_color))
+        layer.fill(self._now_playing_bg)
+
+        # --- HEADER ---
+        pygame.draw.rect(layer, (0, 0, 0), (0, 0, self.config.SCREEN_WIDTH, header_height))
         font_header = self.config.font_header
         header_text = font_header.render("Now Playing", True, (255, 255, 255))
-        self.screen.blit(header_text, (8, 4))
+        layer.blit(header_text, (8, 4))
         # Flecha azul a la derecha
-        arrow_font = pygame.font.SysFont(None, 22, bold=True)
+        arrow_font = self.get_font(22, bold=True)
         arrow = arrow_font.render("▶", True, (0, 120, 255))
-        self.screen.blit(arrow, (self.config.SCREEN_WIDTH - 22, 4))
+        layer.blit(arrow, (self.config.SCREEN_WIDTH - 22, 4))
 
         # --- CARÁTULA ---
         album_art_size = 90
         album_art_x = 12
         album_art_y = header_height + 10
         # Mostrar carátula desde metadatos si es posible
-        cover_flow = getattr(self, 'cover_flow', None)
         song_cover = None
         if song_data and cover_flow:
             _id, path, title, artist, album, duration_s = song_data
-            song_cover = cover_flow.get_album_art(album, None, (album_art_size, album_art_size), path)
+            song_cover = cover_flow.get_album_art(album, cover_flow.resolve_art_path(path), (album_art_size, album_art_size), path,
+                                                  artwork_id)
         if song_cover:
-            self.screen.blit(song_cover, (album_art_x, album_art_y))
+            layer.blit(song_cover, (album_art_x, album_art_y))
         else:
-            pygame.draw.rect(self.screen, (230, 230, 230), (album_art_x, album_art_y, album_art_size, album_art_size))
-            pygame.draw.rect(self.screen, (180, 180, 180), (album_art_x, album_art_y, album_art_size, album_art_size), 1)
+            pygame.draw.rect(layer, (230, 230, 230), (album_art_x, album_art_y, album_art_size, album_art_size))
+            pygame.draw.rect(layer, (180, 180, 180), (album_art_x, album_art_y, album_art_size, album_art_size), 1)
             # Placeholder de texto
-            art_font = pygame.font.SysFont(None, 18)
+            art_font = self.get_font(18)
             art_text_surf = art_font.render("Album Art", True, (180, 180, 180))
             art_text_rect = art_text_surf.get_rect(center=(album_art_x + album_art_size // 2, album_art_y + album_art_size // 2))
-            self.screen.blit(art_text_surf, art_text_rect)
+            layer.blit(art_text_surf, art_text_rect)
 
         # --- INFO DE LA CANCIÓN ---
         if not song_data:
             no_song_text = self.config.font_now_playing_title.render("No hay canción", True, (0, 0, 0))
             text_rect = no_song_text.get_rect(left=album_art_x + album_art_size + 15, top=album_art_y)
-            self.screen.blit(no_song_text, text_rect)
+            layer.blit(no_song_text, text_rect)
             return
         _id, path, title, artist, album, duration_s = song_data
         text_x = album_art_x + album_art_size + 15
         text_y = album_art_y
         # Título
-        title_font = pygame.font.SysFont(None, 20, bold=True)
-        title_str = title[:32] + ("..." if len(title) > 32 else "")
-        title_surf = title_font.render(title_str, True, (0, 0, 0))
-        self.screen.blit(title_surf, (text_x, text_y))
-        text_y += title_surf.get_height() + 2
+        title_font = self.get_font(20, bold=True)
+        text_width = self.config.SCREEN_WIDTH - text_x - 10
+        if self.marquee_enabled:
+            # Rendered once per song; a long title scrolls inside its rect
+            self.title_marquee.set_text(title_font, title, (0, 0, 0), text_width)
+            if self.title_marquee.scrolling:
+                self._now_playing_title_pos = (text_x, text_y)
+            else:
+                self.title_marquee.draw(layer, (text_x, text_y))
+        else:
+            title_surf = title_font.render(self.config.fit_text(title_font, title, text_width), True, (0, 0, 0))
+            layer.blit(title_surf, (text_x, text_y))
+        text_y += title_font.get_height() + 2
         # Artista
-        artist_font = pygame.font.SysFont(None, 16)
-        artist_str = artist[:32] + ("..." if len(artist) > 32 else "")
+        artist_font = self.get_font(16)
+        artist_str = self.config.fit_text(artist_font, artist, text_width)
         artist_surf = artist_font.render(artist_str, True, (80, 80, 80))
-        self.screen.blit(artist_surf, (text_x, text_y))
+        layer.blit(artist_surf, (text_x, text_y))
         text_y += artist_surf.get_height() + 1
         # Álbum
-        album_font = pygame.font.SysFont(None, 14)
-        album_str = album[:32] + ("..." if len(album) > 32 else "")
+        album_font = self.get_font(14)
+        album_str = self.config.fit_text(album_font, album, text_width)
         album_surf = album_font.render(album_str, True, (120, 120, 120))
-        self.screen.blit(album_surf, (text_x, text_y))
+        layer.blit(album_surf, (text_x, text_y))
 
+    def _compose_now_playing_progress(self, current_position, duration_s):
+        """Compose the progress bar and both times (only when the displayed second changes)"""
         # --- BARRA DE PROGRESO Y TIEMPOS ---
         progress_bar_width = self.config.SCREEN_WIDTH - 40
         progress_bar_x = 20
         progress_bar_height = 6
         progress_bar_y = self.config.DISPLAY_HEIGHT - 32
-        # Barra de fondo
-        pygame.draw.rect(self.screen, (220, 220, 220), (progress_bar_x, progress_bar_y, progress_bar_width, progress_bar_height), border_radius=3)
+        if self._now_playing_progress is None:
+            self._now_playing_progress_rect = pygame.Rect(0, progress_bar_y, self.config.SCREEN_WIDTH,
+                                                          self.config.DISPLAY_HEIGHT - progress_bar_y)
+            self._now_playing_progress = pygame.Surface(self._now_playing_progress_rect.size)
+        layer = self._now_playing_progress
+        layer.fill(self._now_playing_bg)
+        # Barra de fondo (coordenadas relativas a la capa)
+        pygame.draw.rect(layer, (220, 220, 220), (progress_bar_x, 0, progress_bar_width, progress_bar_height), border_radius=3)
         # Barra de progreso azul
         if duration_s > 0:
             progress = max(0.0, min(1.0, current_position / duration_s))
             filled_width = int(progress * progress_bar_width)
-            pygame.draw.rect(self.screen, (0, 153, 255), (progress_bar_x, progress_bar_y, filled_width, progress_bar_height), border_radius=3)
+            pygame.draw.rect(layer, (0, 153, 255), (progress_bar_x, 0, filled_width, progress_bar_height), border_radius=3)
         # Tiempo actual (izquierda)
-        time_font = pygame.font.SysFont(None, 16)
+        time_font = self.get_font(16)
         time_current_str = self.config.format_time(current_position)
         current_time_surf = time_font.render(time_current_str, True, (0, 0, 0))
-        self.screen.blit(current_time_surf, (progress_bar_x, progress_bar_y + progress_bar_height + 4))
+        layer.blit(current_time_surf, (progress_bar_x, progress_bar_height + 4))
         # Tiempo restante (derecha)
         if duration_s > 0:
             remaining_s = duration_s - current_position
@@ -214,8 +422,8 @@ class iPodRenderer:
         else:
             time_remaining_str = "-00:00"
         remaining_time_surf = time_font.render(time_remaining_str, True, (0, 0, 0))
-        remaining_time_rect = remaining_time_surf.get_rect(right=progress_bar_x + progress_bar_width, top=progress_bar_y + progress_bar_height + 4)
-        self.screen.blit(remaining_time_surf, remaining_time_rect)
+        remaining_time_rect = remaining_time_surf.get_rect(right=progress_bar_x + progress_bar_width, top=progress_bar_height + 4)
+        layer.blit(remaining_time_surf, remaining_time_rect)
 
     def draw_mini_player(self, song_data, current_position, duration, is_playing, is_paused):
         """Draw mini player at bottom of screen"""
@@ -224,22 +432,25 @@ class iPodRenderer:
         
         mini_player_rect = pygame.Rect(0, self.config.DISPLAY_HEIGHT - self.config.mini_player_height, 
                                       self.config.SCREEN_WIDTH, self.config.mini_player_height)
-        # Create a surface for transparency
-        s = pygame.Surface((self.config.SCREEN_WIDTH, self.config.mini_player_height), pygame.SRCALPHA)
+        # Surface for transparency, reused from the pool
+        s = self.config.surface_pool.acquire(mini_player_rect.size, pygame.SRCALPHA)
         s.fill(self.config.MINI_PLAYER_BG)
-        self.screen.blit(s, (0, self.config.DISPLAY_HEIGHT - self.config.mini_player_height))
+        self.screen.blit(s, mini_player_rect.topleft)
+        self.config.surface_pool.release(s)
 
         _id, _path, title, artist, _album, duration_s = song_data
         
-        display_text = title[:25] + "..." if len(title) > 25 else title
         if is_playing and not is_paused: 
             icon = "▶ "
         elif is_paused: 
             icon = "❚❚ "
         else: 
             icon = ""
+        # Hasta la mini barra de progreso (80 px a la derecha)
+        display_text = self.config.fit_text(self.config.font_mini_player, icon + title,
+                                            self.config.SCREEN_WIDTH - 80 - 5 - 5 - self.TEXT_PADDING)
         
-        text_surf = self.config.font_mini_player.render(icon + display_text, True, self.config.MINI_PLAYER_TEXT)
+        text_surf = self.config.font_mini_player.render(display_text, True, self.config.MINI_PLAYER_TEXT)
         self.screen.blit(text_surf, (5, self.config.DISPLAY_HEIGHT - self.config.mini_player_height + 
                                    (self.config.mini_player_height - text_surf.get_height()) // 2))
 
@@ -273,206 +484,35 @@ class iPodRenderer:
     def draw_settings_menu(self, menu_items, selected_index, scroll_offset):
         """Draw settings menu with special formatting"""
         y_offset = self.config.header_height + 5
-        
-        for i in range(self.config.visible_items_limit):
-            current_item_index = scroll_offset + i
-            if current_item_index >= len(menu_items):
-                break
-
-            item = menu_items[current_item_index]
-            item_y_pos = y_offset + (i * self.config.item_height)
-            
-            is_selected = (current_item_index == selected_index)
-            
-            if is_selected:
-                pygame.draw.rect(self.screen, self.config.MENU_ITEM_SELECTED_BG, 
-                               (0, item_y_pos, self.config.SCREEN_WIDTH, self.config.item_height))
-                text_color = self.config.MENU_ITEM_SELECTED_TEXT
-            else:
-                text_color = self.config.MENU_ITEM_TEXT
-                
-            label_text = item.get("label", "")
-            if len(label_text) > 35: 
-                label_text = label_text[:32] + "..."
-            text_surf = self.config.font_menu_item.render(label_text, True, text_color)
-            self.screen.blit(text_surf, (10, item_y_pos + (self.config.item_height - text_surf.get_height()) // 2))
-
-            if is_selected:
-                arrow_surf = self.config.font_menu_item.render("›", True, text_color)
-                self.screen.blit(arrow_surf, (self.config.SCREEN_WIDTH - 20, 
-                                            item_y_pos + (self.config.item_height - arrow_surf.get_height()) // 2))
+        list_area = pygame.Rect(0, y_offset, self.config.SCREEN_WIDTH,
+                                self.config.visible_items_limit * self.config.item_height)
+        self.draw_list(menu_items, selected_index, scroll_offset, list_area, "settings")
 
     def draw_menu_with_album_art(self, menu_items, selected_index, scroll_offset, list_type, cover_flow=None, albums=None):
         """Dibuja el menú clásico a la izquierda y un carrusel de portadas de álbumes a la derecha con animación aleatoria de desplazamiento"""
+        # El fondo y la cabecera ya los dibuja el bucle principal
         menu_width = self.config.SCREEN_WIDTH // 2
-        art_width = self.config.SCREEN_WIDTH - menu_width
-        menu_area = pygame.Rect(0, 0, menu_width, self.config.DISPLAY_HEIGHT)
-        art_area = pygame.Rect(menu_width, 0, art_width, self.config.DISPLAY_HEIGHT)
-        self.screen.fill(self.config.BG_COLOR)
-        self.draw_header("iPod", False, False)
-        menu_surface = pygame.Surface((menu_width, self.config.DISPLAY_HEIGHT), pygame.SRCALPHA)
-        y_offset = self.config.header_height + 3
-        for i in range(self.config.visible_items_limit):
-            current_item_index = scroll_offset + i
-            if current_item_index >= len(menu_items):
-                break
-            item = menu_items[current_item_index]
-            item_y_pos = y_offset + (i * self.config.item_height)
-            is_selected = (current_item_index == selected_index)
-            if is_selected:
-                selection_rect = pygame.Rect(3, item_y_pos, menu_width - 6, self.config.item_height)
-                pygame.draw.rect(menu_surface, self.config.MENU_ITEM_SELECTED_BG, selection_rect, border_radius=6)
-                text_color = self.config.MENU_ITEM_SELECTED_TEXT
-                sub_text_color = self.config.MENU_ITEM_SELECTED_TEXT
-            else:
-                text_color = self.config.MENU_ITEM_TEXT
-                sub_text_color = self.config.GRAY
-            label_text = item.get("label", "")
-            if len(label_text) > 18:
-                label_text = label_text[:15] + "..."
-            text_surf = self.config.font_menu_item.render(label_text, True, text_color)
-            menu_surface.blit(text_surf, (12, item_y_pos + (self.config.item_height - text_surf.get_height()) // 2))
-            if "sublabel" in item and list_type == "songs":
-                sub_label_text = item.get("sublabel", "")
-                if len(sub_label_text) > 15:
-                    sub_label_text = sub_label_text[:12] + "..."
-                sub_text_surf = self.config.font_menu_item_small.render(sub_label_text, True, sub_text_color)
-                sub_y = item_y_pos + (self.config.item_height // 2) + 4
-                menu_surface.blit(sub_text_surf, (15, sub_y))
-            if is_selected and item.get("action") != "none":
-                arrow_surf = self.config.font_menu_item.render("›", True, text_color)
-                arrow_x = menu_width - arrow_surf.get_width() - 12
-                arrow_y = item_y_pos + (self.config.item_height - arrow_surf.get_height()) // 2
-                menu_surface.blit(arrow_surf, (arrow_x, arrow_y))
+        list_area = pygame.Rect(0, self.config.header_height + 3, menu_width,
+                                self.config.visible_items_limit * self.config.item_height)
+        scroll_position = self.draw_list(menu_items, selected_index, scroll_offset, list_area, "split",
+                                         list_type == "songs")
         if len(menu_items) > self.config.visible_items_limit:
-            list_height_pixels = self.config.visible_items_limit * self.config.item_height
-            scrollbar_width = 4
-            scrollbar_x = menu_width - scrollbar_width - 2
-            scrollbar_y = self.config.header_height + 3
-            scrollbar_bg_rect = pygame.Rect(scrollbar_x, scrollbar_y, scrollbar_width, list_height_pixels)
-            pygame.draw.rect(menu_surface, self.config.SCROLL_BAR_BG, scrollbar_bg_rect, border_radius=2)
-            thumb_height = max(8, (self.config.visible_items_limit / len(menu_items)) * list_height_pixels)
-            thumb_y_offset = (scroll_offset / len(menu_items)) * list_height_pixels
-            thumb_y = scrollbar_y + thumb_y_offset
-            scrollbar_fg_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_height)
-            pygame.draw.rect(menu_surface, self.config.SCROLL_BAR_FG, scrollbar_fg_rect, border_radius=2)
-        self.screen.blit(menu_surface, (0, 0))
+            self.draw_scrollbar(menu_items, scroll_position, menu_width)
 
         # --- PORTADAS DERECHA CON ANIMACIÓN ALEATORIA ---
-        art_surface = pygame.Surface((art_width, self.config.DISPLAY_HEIGHT), pygame.SRCALPHA)
-        center_x = art_width // 2
-        center_y = self.config.DISPLAY_HEIGHT // 2
-        cover_size = (min(art_width - 40, 120), min(self.config.DISPLAY_HEIGHT - 80, 120))
-
-        # Animación: mantener estado entre frames
-        if not hasattr(self, '_album_anim_state'):
-            self._album_anim_state = {
-                'last_idx': -1,
-                'direction': (0, 1),
-                'progress': 1.0,
-                'start_time': 0,
-                'duration': 0.7,
-                'next_idx': 0
-            }
-        anim = self._album_anim_state
         # Determinar lista de álbumes
         album_list = []
         if list_type == "albums" and albums:
             album_list = albums
         elif cover_flow and hasattr(cover_flow, "cover_flow_albums") and cover_flow.cover_flow_albums:
             album_list = cover_flow.cover_flow_albums
-        # Si no hay álbumes, placeholder
-        if not album_list:
-            art = pygame.Surface(cover_size)
-            art.fill(self.config.NOW_PLAYING_ALBUM_ART_BG)
-            pygame.draw.rect(art, self.config.ALBUM_ART_BORDER_COLOR, art.get_rect(), 1)
-            font = pygame.font.SysFont(None, 18)
-            text = font.render("Sin portada", True, self.config.ALBUM_ART_BORDER_COLOR)
-            text_rect = text.get_rect(center=(cover_size[0]//2, cover_size[1]//2))
-            art.blit(text, text_rect)
-            art_rect = art.get_rect(center=(center_x, center_y))
-            art_surface.blit(art, art_rect)
-            self.screen.blit(art_surface, (menu_width, 0))
-            return
         # Selección de índice
         idx = 0
+        lookahead = (1,)
         if list_type == "albums" and albums:
             idx = selected_index if 0 <= selected_index < len(album_list) else 0
-        else:
+            lookahead = (1, -1)  # El usuario puede moverse en ambas direcciones
+        elif album_list:
             # Carrusel automático
             idx = (pygame.time.get_ticks() // 2500) % len(album_list)
-        # Si cambió el álbum, elegir nueva dirección aleatoria
-        if anim['last_idx'] != idx:
-            directions = [
-                (0, -1),  # arriba
-                (0, 1),   # abajo
-                (1, 0),   # derecha
-                (-1, 0),  # izquierda
-                (1, 1),   # diagonal abajo derecha
-                (-1, 1),  # diagonal abajo izquierda
-                (1, -1),  # diagonal arriba derecha
-                (-1, -1)  # diagonal arriba izquierda
-            ]
-            anim['direction'] = random.choice(directions)
-            anim['progress'] = 0.0
-            anim['start_time'] = pygame.time.get_ticks() / 1000.0
-            anim['duration'] = 0.7 + random.random() * 0.5
-            anim['next_idx'] = idx
-        # Progreso de animación
-        now = pygame.time.get_ticks() / 1000.0
-        t = min(1.0, (now - anim['start_time']) / anim['duration'])
-        anim['progress'] = t
-        # Interpolación
-        prev_idx = anim['last_idx'] if anim['last_idx'] >= 0 else idx
-        next_idx = anim['next_idx']
-        # Obtener nombres y paths
-        def get_album_info(album):
-            if isinstance(album, dict):
-                return album.get("name") or album.get("label"), album.get("art_path"), album.get("song_path")
-            return str(album), None, None
-        prev_name, prev_path, prev_song_path = get_album_info(album_list[prev_idx])
-        next_name, next_path, next_song_path = get_album_info(album_list[next_idx])
-        # Obtener portadas
-        if cover_flow:
-            prev_art = cover_flow.get_album_art(prev_name, prev_path, cover_size, prev_song_path)
-            next_art = cover_flow.get_album_art(next_name, next_path, cover_size, next_song_path)
-        else:
-            prev_art = pygame.Surface(cover_size)
-            prev_art.fill(self.config.NOW_PLAYING_ALBUM_ART_BG)
-            next_art = prev_art.copy()
-        # Calcular desplazamiento
-        # Animación lenta y cambio de dirección cada 3 segundos
-        if not hasattr(self, '_album_anim_last_change'):
-            self._album_anim_last_change = 0
-        ticks = pygame.time.get_ticks()
-        now_sec = ticks / 1000.0
-        if now_sec - self._album_anim_last_change > 3.0:
-            directions = [
-                (0, -1),  # arriba
-                (0, 1),   # abajo
-                (1, 0),   # derecha
-                (-1, 0),  # izquierda
-                (1, 1),   # diagonal abajo derecha
-                (-1, 1),  # diagonal abajo izquierda
-                (1, -1),  # diagonal arriba derecha
-                (-1, -1)  # diagonal arriba izquierda
-            ]
-            anim['direction'] = random.choice(directions)
-            anim['start_time'] = now_sec
-            anim['duration'] = 2.5 + random.random() * 1.0  # 2.5-3.5s
-            self._album_anim_last_change = now_sec
-        dx, dy = anim['direction']
-        t = anim['progress']
-        offset_x = int((1-t) * dx * art_width * 0.7)
-        offset_y = int((1-t) * dy * self.config.DISPLAY_HEIGHT * 0.7)
-        # Dibuja portada anterior desplazándose fuera
-        if anim['last_idx'] != -1 and t < 1.0:
-            prev_rect = prev_art.get_rect(center=(center_x - offset_x, center_y - offset_y))
-            art_surface.blit(prev_art, prev_rect)
-        # Dibuja portada nueva entrando
-        next_rect = next_art.get_rect(center=(center_x + (art_width * dx * (1-t)), center_y + (self.config.DISPLAY_HEIGHT * dy * (1-t))))
-        art_surface.blit(next_art, next_rect)
-        self.screen.blit(art_surface, (menu_width, 0))
-        # Si terminó la animación, actualizar last_idx
-        if t >= 1.0:
-            anim['last_idx'] = next_idx
+        self.album_carousel.draw(self.screen, album_list, idx, cover_flow, lookahead)
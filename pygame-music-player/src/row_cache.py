@@ -0,0 +1,46 @@
+"""
+Row cache module for iPod Classic interface.
+Keeps rendered menu rows (selection bar, label, sublabel, arrow) so a
+list frame is a handful of blits: only rows whose label, selected state
+or width changed are rendered again.
+"""
+from collections import OrderedDict
+
+
+class RowSurfaceCache:
+    """LRU cache of rendered list row surfaces"""
+
+    def __init__(self, max_rows=96):
+        self.max_rows = max_rows
+        self.rows = OrderedDict()  # (style, width, label, sublabel, arrow, selected, fonts) -> surface
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+
+    def get(self, key):
+        row = self.rows.get(key)
+        if row is None:
+            self.misses += 1
+            return None
+        self.rows.move_to_end(key)
+        self.hits += 1
+        return row
+
+    def put(self, key, surface):
+        self.rows[key] = surface
+        self.rows.move_to_end(key)
+        self.renders += 1
+        while len(self.rows) > self.max_rows:
+            self.rows.popitem(last=False)
+
+    def clear(self):
+        self.rows.clear()
+
+    def get_stats(self):
+        return {
+            "rows": len(self.rows),
+            "max_rows": self.max_rows,
+            "hits": self.hits,
+            "misses": self.misses,
+            "renders": self.renders,
+        }
@@ -0,0 +1,166 @@
+"""
+Surface effects module for iPod Classic interface.
+Vectorized gradients and cover reflections built with NumPy through
+pygame.surfarray, with a plain pygame fallback when NumPy is missing.
+"""
+import pygame
+import math
+try:
+    import numpy
+    import pygame.surfarray
+    NUMPY_AVAILABLE = True
+except ImportError:
+    numpy = None
+    NUMPY_AVAILABLE = False
+
+
+def _color_channels(color):
+    """Return (r, g, b, a) for an RGB or RGBA tuple"""
+    if len(color) == 4:
+        return tuple(color)
+    return tuple(color) + (255,)
+
+
+def vertical_gradient(size, top_color, bottom_color, border_radius=0):
+    """Create a SRCALPHA surface filled with a top-to-bottom gradient.
+
+    Colors may be RGB or RGBA. With border_radius the corners are rounded
+    like pygame.draw.rect(..., border_radius=...).
+    """
+    width, height = int(size[0]), int(size[1])
+    surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+    top = _color_channels(top_color)
+    bottom = _color_channels(bottom_color)
+
+    if NUMPY_AVAILABLE and height > 0:
+        ramp = numpy.linspace(0.0, 1.0, height, dtype=numpy.float32)[:, None]
+        colors = numpy.array(top, dtype=numpy.float32) + (numpy.array(bottom, dtype=numpy.float32) - numpy.array(top, dtype=numpy.float32)) * ramp
+        colors = colors.round().astype(numpy.uint8)  # (height, 4)
+        rgb = pygame.surfarray.pixels3d(surface)
+        rgb[:] = colors[None, :, :3]
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:] = colors[None, :, 3]
+        del alpha  # Unlock the surface
+    else:
+        for y in range(height):
+            t = y / max(1, height - 1)
+            color = tuple(int(round(a + (b - a) * t)) for a, b in zip(top, bottom))
+            pygame.draw.line(surface, color, (0, y), (width - 1, y))
+
+    if border_radius > 0:
+        mask = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=border_radius)
+        surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return surface
+
+
+def make_reflection(surface, height_ratio=0.4, start_alpha=80, end_alpha=10):
+    """Build the faded, mirrored reflection shown under a cover.
+
+    The alpha ramp goes from start_alpha right under the cover to end_alpha
+    at the bottom and is multiplied into the mirrored pixels in one step.
+    """
+    reflection_height = int(surface.get_height() * height_ratio)
+    if reflection_height <= 0:
+        return None
+    flipped = pygame.transform.flip(surface, False, True)
+    reflection = pygame.Surface((surface.get_width(), reflection_height), pygame.SRCALPHA)
+    reflection.blit(flipped, (0, 0), (0, 0, surface.get_width(), reflection_height))
+
+    if NUMPY_AVAILABLE:
+        # Same steps as the fallback: start_alpha - int(y / height * (start_alpha - end_alpha))
+        fade = numpy.trunc(numpy.linspace(0.0, start_alpha - end_alpha, reflection_height, endpoint=False))
+        ramp = numpy.maximum(end_alpha, start_alpha - fade).astype(numpy.uint16)[None, :]
+        alpha = pygame.surfarray.pixels_alpha(reflection)
+        alpha[:] = (alpha * ramp // 255).astype(numpy.uint8)
+        del alpha  # Unlock the surface
+    else:
+        ramp_values = [max(end_alpha, start_alpha - int((y / reflection_height) * (start_alpha - end_alpha)))
+                       for y in range(reflection_height)]
+        alpha_surface = pygame.Surface(reflection.get_size(), pygame.SRCALPHA)
+        for y, alpha_value in enumerate(ramp_values):
+            pygame.draw.line(alpha_surface, (255, 255, 255, alpha_value), (0, y), (reflection.get_width(), y))
+        reflection.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return reflection
+
+
+_perspective_maps = {}
+
+
+def perspective_map(src_size, angle_deg, facing, focal_ratio=2.5):
+    """Precompute the pixel lookup table for a perspective-rotated cover.
+
+    The cover is turned angle_deg around its vertical axis. facing=-1 brings
+    the right edge towards the viewer (covers left of the focused one),
+    facing=1 the left edge. Returns (source_index, mask), both of shape
+    (dest_width, dest_height): source_index holds flat indexes into the
+    source pixels (column * height + row) for a single gather per channel,
+    mask is False where a destination pixel lies outside the cover.
+    Tables are cached per (size, angle, facing).
+    """
+    key = (tuple(src_size), angle_deg, facing, focal_ratio)
+    cached = _perspective_maps.get(key)
+    if cached is not None:
+        return cached
+
+    width, height = src_size
+    cos_a = math.cos(math.radians(angle_deg))
+    sin_a = math.sin(math.radians(angle_deg))
+    focal = focal_ratio * width
+    depth = facing * width * sin_a  # Depth change per unit of cover position
+
+    def project(t):
+        return focal * t * width * cos_a / (focal + depth * t)
+
+    x_min, x_max = project(-0.5), project(0.5)
+    dest_width = max(1, int(math.ceil(x_max - x_min)))
+    xs = x_min + numpy.arange(dest_width, dtype=numpy.float64) + 0.5
+    # Invert the projection: destination column -> position t along the cover
+    t = xs * focal / (focal * width * cos_a - depth * xs)
+    t = numpy.clip(t, -0.5, 0.5)
+    source_columns = numpy.clip(((t + 0.5) * width).astype(numpy.intp), 0, width - 1)
+
+    column_heights = height * focal / (focal + depth * t)
+    dest_height = max(1, int(math.ceil(column_heights.max())))
+    tops = (dest_height - column_heights) / 2.0
+    ys = numpy.arange(dest_height, dtype=numpy.float64) + 0.5
+    rows = (ys[None, :] - tops[:, None]) * height / column_heights[:, None]
+    mask = (rows >= 0) & (rows < height)
+    source_rows = numpy.clip(rows, 0, height - 1).astype(numpy.intp)
+
+    # Flat indexes into a (width * height) pixel buffer for a single gather per channel
+    source_index = (source_columns[:, None] * height + source_rows)
+    cached = (source_index, mask)
+    _perspective_maps[key] = cached
+    return cached
+
+
+def perspective_warp(surface, angle_deg, facing, alpha=255):
+    """Warp a cover into a perspective-skewed SRCALPHA surface, baking in alpha.
+
+    Returns None when NumPy is not available so callers can fall back to
+    pygame.transform.rotate.
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+    source_index, mask = perspective_map(surface.get_size(), angle_deg, facing)
+    if surface.get_bitsize() != 32:
+        surface = surface.convert(32, pygame.SRCALPHA)
+    width, height = surface.get_size()
+    warped = pygame.Surface(mask.shape, pygame.SRCALPHA)
+
+    source_rgb = pygame.surfarray.pixels3d(surface)
+    warped_rgb = pygame.surfarray.pixels3d(warped)
+    warped_rgb[:] = source_rgb.reshape(width * height, 3)[source_index]
+    del source_rgb, warped_rgb
+
+    source_alpha = pygame.surfarray.array_alpha(surface).reshape(width * height)
+    sampled_alpha = source_alpha[source_index]
+    if alpha < 255:
+        sampled_alpha = (sampled_alpha.astype(numpy.uint16) * alpha // 255).astype(numpy.uint8)
+    sampled_alpha[~mask] = 0
+    warped_alpha = pygame.surfarray.pixels_alpha(warped)
+    warped_alpha[:] = sampled_alpha
+    del warped_alpha  # Unlock the surfaces
+    return warped
@@ -0,0 +1,61 @@
+"""
+Surface pool module for iPod Classic interface.
+Reuses the scratch surfaces of translucent overlays (mini player, video
+controls, YouTube info box, Cover Flow staging layers) instead of
+allocating a new pygame.Surface every frame.
+"""
+import pygame
+
+
+class SurfacePool:
+    """Free lists of surfaces keyed by (size, flags), with explicit acquire/release"""
+
+    def __init__(self, max_free_per_key=4):
+        self.max_free_per_key = max_free_per_key
+        self._free = {}  # (size, flags) -> [surface, ...]
+        self._in_use = {}  # id(surface) -> (size, flags) of acquired surfaces
+        self.allocations = 0
+        self.reuses = 0
+        self.releases = 0
+        self.discarded = 0
+
+    def acquire(self, size, flags=0):
+        """Return a surface of the given size and flags. Its previous contents (and alpha) are
+        undefined: callers fill it. Give it back with release() once it has been blitted."""
+        key = ((int(size[0]), int(size[1])), flags)
+        free = self._free.get(key)
+        if free:
+            surface = free.pop()
+            self.reuses += 1
+        else:
+            surface = pygame.Surface(key[0], flags)
+            self.allocations += 1
+        self._in_use[id(surface)] = key
+        return surface
+
+    def release(self, surface):
+        """Return an acquired surface to its free list"""
+        key = self._in_use.pop(id(surface), None)
+        if key is None:
+            print("SurfacePool: release() of a surface that was not acquired")
+            return
+        self.releases += 1
+        free = self._free.setdefault(key, [])
+        if len(free) < self.max_free_per_key:
+            free.append(surface)
+        else:
+            self.discarded += 1
+
+    def clear(self):
+        """Drop the free surfaces (acquired ones stay valid)"""
+        self._free.clear()
+
+    def get_stats(self):
+        return {
+            "allocations": self.allocations,
+            "reuses": self.reuses,
+            "releases": self.releases,
+            "discarded": self.discarded,
+            "in_use": len(self._in_use),
+            "free": sum(len(free) for free in self._free.values()),
+        }
@@ -0,0 +1,34 @@
+"""
+Regression check: switching the font in Settings must re-render cached menu rows.
+Run with: python test/test_row_cache_font.py (or pytest)
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from ui_config import UIConfig
+from renderer import iPodRenderer
+
+
+def test_font_switch_rerenders_rows():
+    pygame.init()
+    config = UIConfig()
+    renderer = iPodRenderer(pygame.Surface((config.SCREEN_WIDTH, config.DISPLAY_HEIGHT)), config)
+    item = {"label": "Songs", "sublabel": "Artist", "action": "open"}
+
+    before = renderer.get_menu_row(item, False, 300, "menu", show_sublabel=True)
+    assert renderer.get_menu_row(item, False, 300, "menu", show_sublabel=True) is before  # Cached
+
+    config.set_font("Arial")
+    after = renderer.get_menu_row(item, False, 300, "menu", show_sublabel=True)
+    assert after is not before, "row rendered with the old font was reused after set_font"
+    assert renderer.get_menu_row(item, False, 300, "menu", show_sublabel=True) is after
+
+
+if __name__ == "__main__":
+    test_font_switch_rerenders_rows()
+    print("OK")
@@ -0,0 +1,67 @@
+"""
+Text fitter module for iPod Classic interface.
+Truncates labels to a pixel width instead of a character count, so
+proportional fonts and non-ASCII titles are cut where they actually
+overflow. Results are memoized, so a label is only measured once.
+"""
+from collections import OrderedDict
+
+
+class TextFitter:
+    """Pixel-width ellipsizing with an LRU of fitted strings"""
+
+    def __init__(self, max_entries=2048, ellipsis="..."):
+        self.max_entries = max_entries
+        self.ellipsis = ellipsis
+        self._fitted = OrderedDict()  # (font, text, width) -> fitted text
+        self.hits = 0
+        self.misses = 0
+        self.measurements = 0
+
+    def fit(self, font, text, max_width):
+        """Return text, or its longest prefix plus the ellipsis, that fits in max_width pixels"""
+        text = str(text)
+        key = (font, text, int(max_width))
+        fitted = self._fitted.get(key)
+        if fitted is not None:
+            self._fitted.move_to_end(key)
+            self.hits += 1
+            return fitted
+        self.misses += 1
+        fitted = self._fit(font, text, int(max_width))
+        self._fitted[key] = fitted
+        while len(self._fitted) > self.max_entries:
+            self._fitted.popitem(last=False)
+        return fitted
+
+    def _fit(self, font, text, max_width):
+        if self._width(font, text) <= max_width:
+            return text
+        if self._width(font, self.ellipsis) > max_width:
+            return ""
+        # Búsqueda binaria del prefijo más largo que cabe con los puntos suspensivos
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._width(font, text[:middle].rstrip() + self.ellipsis) <= max_width:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low].rstrip() + self.ellipsis
+
+    def _width(self, font, text):
+        self.measurements += 1
+        return font.size(text)[0]
+
+    def clear(self):
+        """Forget fitted strings (e.g. after the fonts changed)"""
+        self._fitted.clear()
+
+    def get_stats(self):
+        return {
+            "entries": len(self._fitted),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "measurements": self.measurements,
+        }
@@ -0,0 +1,120 @@
+"""
+Thumbnail atlas module for iPod Classic interface.
+Packs fixed-size album art thumbnails into a few large page surfaces
+instead of one surface allocation per cover, reusing slots in LRU order.
+"""
+import pygame
+from collections import OrderedDict
+
+
+class ThumbnailAtlas:
+    """Fixed-slot atlas for thumbnails of a single size.
+
+    Every cover gets a rect handle (page surface, slot rect) to blit from,
+    plus a subsurface view of its slot for code that expects a surface.
+    A view stays valid until its slot is handed to another cover.
+    """
+
+    def __init__(self, slot_size, max_slots=48, page_columns=4, page_rows=4, on_evict=None):
+        self.slot_size = tuple(slot_size)
+        self.on_evict = on_evict  # Called as on_evict(key, view) before a slot is reused
+        self.max_slots = max_slots
+        self.page_columns = page_columns
+        self.page_rows = page_rows
+        self.pages = []
+        self.free_slots = []  # (page index, rect) not assigned to any cover
+        self.entries = OrderedDict()  # key -> (page index, rect, view)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def slots_per_page(self):
+        return self.page_columns * self.page_rows
+
+    def _add_page(self):
+        """Allocate a new page and register its slots as free"""
+        width, height = self.slot_size
+        page_index = len(self.pages)
+        slots = min(self.slots_per_page, self.max_slots - page_index * self.slots_per_page)
+        rows = -(-slots // self.page_columns)  # The last page only gets the rows it needs
+        page = pygame.Surface((width * self.page_columns, height * rows))
+        self.pages.append(page)
+        for slot in range(slots):
+            row, column = divmod(slot, self.page_columns)
+            self.free_slots.append((page_index, pygame.Rect(column * width, row * height, width, height)))
+
+    def _allocate_slot(self):
+        """Return a free (page index, rect), growing the atlas or evicting the least recently used cover"""
+        if not self.free_slots and len(self.pages) * self.slots_per_page < self.max_slots:
+            self._add_page()
+        if self.free_slots:
+            return self.free_slots.pop()
+        old_key, (page_index, rect, view) = self.entries.popitem(last=False)
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(old_key, view)
+        return page_index, rect
+
+    def get_handle(self, key):
+        """Return (page surface, slot rect) for a cover, or None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return self.pages[entry[0]], entry[1]
+
+    def get_surface(self, key):
+        """Return the subsurface view of a cover's slot, or None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def put(self, key, surface):
+        """Copy a thumbnail into a slot (scaling it if needed) and return the slot's view"""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            page_index, rect = entry[0], entry[1]
+        else:
+            page_index, rect = self._allocate_slot()
+        if surface.get_size() != self.slot_size:
+            surface = pygame.transform.smoothscale(surface, self.slot_size)
+        page = self.pages[page_index]
+        page.fill((0, 0, 0), rect)  # Que no se transparente la carátula anterior del slot
+        page.blit(surface, rect)
+        # Nueva vista para que las cachés que comparan por identidad detecten el cambio
+        view = page.subsurface(rect)
+        self.entries[key] = (page_index, rect, view)
+        return view
+
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.free_slots.append((entry[0], entry[1]))
+
+    def clear(self):
+        """Release every slot (pages are kept for reuse)"""
+        for page_index, rect, _view in self.entries.values():
+            self.free_slots.append((page_index, rect))
+        self.entries.clear()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get_stats(self):
+        return {
+            "slot_size": self.slot_size,
+            "pages": len(self.pages),
+            "entries": len(self.entries),
+            "max_slots": self.max_slots,
+            "bytes_used": sum(page.get_pitch() * page.get_height() for page in self.pages),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
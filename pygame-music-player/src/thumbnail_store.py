@@ -0,0 +1,127 @@
+"""
+Thumbnail store module for iPod Classic interface.
+Persistent on-disk cache of pre-scaled album art, keyed by the content hash
+of the embedded/external image and invalidated by the source file's mtime.
+"""
+import pygame
+import os
+import sqlite3
+from pathlib import Path
+from art_extractor import hash_art
+
+
+class ThumbnailStore:
+    """Stores pre-scaled album art as raw RGB files so warm launches skip tag parsing and JPEG decoding"""
+
+    # Sizes used by the UI: Cover Flow focused/Now Playing, side covers, album carousel
+    THUMBNAIL_SIZES = ((90, 90), (60, 60), (120, 120))
+    PIXEL_FORMAT = 'RGB'
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = str(self.cache_dir / "index.db")
+        self.init_index()
+
+    def init_index(self):
+        """Create the source -> art hash index"""
+        conn = sqlite3.connect(self.index_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS art_sources (
+                source_path TEXT PRIMARY KEY,
+                last_modified REAL,
+                art_hash TEXT
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def hash_art(image_bytes):
+        """Content hash used as the thumbnail key"""
+        return hash_art(image_bytes)
+
+    def _thumbnail_path(self, art_hash, size):
+        return self.cache_dir / art_hash[:2] / f"{art_hash}_{size[0]}x{size[1]}.rgb"
+
+    def lookup(self, source_path):
+        """Return the art hash recorded for a source file.
+
+        None means unknown or stale (the file changed since it was indexed),
+        an empty string means the file is known to have no artwork.
+        """
+        try:
+            mtime = os.path.getmtime(source_path)
+        except OSError:
+            return None
+        conn = sqlite3.connect(self.index_path)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT last_modified, art_hash FROM art_sources WHERE source_path = ?",
+            (str(source_path),)
+        )
+        result = cursor.fetchone()
+        conn.close()
+        if result is None or result[0] != mtime:
+            return None
+        return result[1] or ""
+
+    def record_source(self, source_path, art_hash):
+        """Remember which artwork (or none, with art_hash=None) a source file carries"""
+        try:
+            mtime = os.path.getmtime(source_path)
+        except OSError:
+            return
+        conn = sqlite3.connect(self.index_path)
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT OR REPLACE INTO art_sources (source_path, last_modified, art_hash) VALUES (?, ?, ?)",
+            (str(source_path), mtime, art_hash or "")
+        )
+        conn.commit()
+        conn.close()
+
+    def has_thumbnail(self, art_hash, size):
+        """Check whether a thumbnail of this size is on disk"""
+        return self._thumbnail_path(art_hash, size).exists()
+
+    def load_bytes(self, art_hash, size):
+        """Read the raw pixel bytes of a stored thumbnail, or None"""
+        try:
+            with open(self._thumbnail_path(art_hash, size), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) != size[0] * size[1] * len(self.PIXEL_FORMAT):
+            return None  # Truncated or corrupt file
+        return data
+
+    def load(self, art_hash, size):
+        """Load a stored thumbnail as a pygame surface, or None"""
+        data = self.load_bytes(art_hash, size)
+        if data is None:
+            return None
+        return pygame.image.fromstring(data, size, self.PIXEL_FORMAT)
+
+    def save_bytes(self, art_hash, size, data):
+        """Write raw pixel bytes for a thumbnail (atomically)"""
+        path = self._thumbnail_path(art_hash, size)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error guardando miniatura {path}: {e}")
+
+    def save(self, art_hash, size, surface):
+        """Write a scaled surface as a thumbnail"""
+        self.save_bytes(art_hash, size, pygame.image.tostring(surface, self.PIXEL_FORMAT))
+
+    def save_all_sizes(self, art_hash, raw_surface, extra_sizes=()):
+        """Scale a decoded cover to every UI size and store the missing thumbnails"""
+        for size in tuple(self.THUMBNAIL_SIZES) + tuple(extra_sizes):
+            if not self.has_thumbnail(art_hash, size):
+                self.save(art_hash, size, pygame.transform.smoothscale(raw_surface, size))
@@ -4,6 +4,8 @@ Contains colors, fonts, layout constants and theme configuration.
 """
 import pygame
 import os
+from text_fitter import TextFitter
+from surface_pool import SurfacePool
 
 
 class UIConfig:
@@ -30,11 +32,15 @@ class UIConfig:
         self.HEADER_BG = (245, 245, 245)  # Very light gray for header
         self.HEADER_TEXT = (0, 0, 0)  # Black text
         self.HEADER_DIVIDER = (180, 180, 180)  # Light gray divider line
+        self.HEADER_GRADIENT_TOP = (252, 252, 252)  # Glossy header gradient
+        self.HEADER_GRADIENT_BOTTOM = (218, 221, 226)
         
         # Menu colors
         self.MENU_ITEM_TEXT = (0, 0, 0)  # Black text
         self.MENU_ITEM_SELECTED_BG = (80, 130, 230)  # iPod's signature blue
         self.MENU_ITEM_SELECTED_TEXT = (255, 255, 255)  # White text on blue
+        self.MENU_ITEM_SELECTED_GRADIENT_TOP = (115, 165, 245)  # Selection bar gradient
+        self.MENU_ITEM_SELECTED_GRADIENT_BOTTOM = (50, 100, 215)
         self.MENU_ARROW = (130, 130, 130)  # Gray arrow for navigation
         
         # Scroll bar colors
@@ -50,6 +56,7 @@ class UIConfig:
         # Album art colors
         self.ALBUM_ART_BORDER_COLOR = (150, 150, 150)  # Gray border
         self.NOW_PLAYING_ALBUM_ART_BG = (240, 240, 240)  # Light gray placeholder
+        self.NOW_PLAYING_TINT_STRENGTH = 0.15  # How much of the cover's dominant color tints the background
         self.NOW_PLAYING_TRACK_INFO_COLOR = (0, 0, 0)  # Black track info
         
         # Mini player colors
@@ -71,11 +78,40 @@ class UIConfig:
         self.item_height = 24  # Slightly smaller for more compact look
         self.header_height = 20  # Compact header like original iPod
         self.mini_player_height = 22  # Compact mini player
+        self.menu_row_cache_size = 96  # Rendered list rows kept for reuse
+        self.list_scroll_speed = 18.0  # Fraction of the remaining scroll distance covered per second
+        self.fps_idle = 30  # Frame rate while nothing moves
+        self.fps_animating = 60  # Frame rate while lists or Cover Flow are scrolling
+        self.menu_transitions = True  # Slide menus left/right on push/pop
+        self.menu_transition_duration = 0.25  # Seconds per menu slide
+        self.marquee_enabled = True  # Scroll titles that don't fit instead of ellipsizing them
+        self.marquee_speed = 30.0  # Pixels per second
+        self.marquee_pause = 1.5  # Seconds the title rests at its start before each pass
+        self.display_backend = "software"  # "software" (blits + flip) or "sdl2" (Renderer/Texture, falls back to software)
         
         # Cover Flow settings
         self.cover_art_size_focused = (80, 80)
         self.cover_art_size_unfocused = (50, 50)
         self.reflection_height_ratio = 0.4  # How much of the image height is reflected
+        self.cover_flow_page_size = 32  # Albums fetched per database query
+        self.cover_flow_max_pages = 8  # Album pages kept in memory
+        self.cover_flow_scrub_threshold = 5.0  # Wheel steps per second before steps start skipping albums
+        self.cover_flow_scrub_max_step = 32  # Most albums skipped by a single wheel step
+        self.cover_flow_settle_delay = 0.15  # Seconds without input before full-quality covers are decoded
+        
+        # Album art cache budgets (bytes of decoded surface memory)
+        self.art_cache_raw_budget_bytes = 8 * 1024 * 1024  # Full-size decoded covers
+        self.art_cache_scaled_budget_bytes = 6 * 1024 * 1024  # Scaled thumbnails
+        self.art_cache_compressed_budget_bytes = 4 * 1024 * 1024  # Evicted thumbnails kept zlib-packed
+        self.art_async_decode = True  # Decode uncached covers on background workers
+        self.art_decode_workers = 2
+        self.art_atlas_sizes = ((60, 60), (90, 90), (120, 120))  # Thumbnails packed into texture atlases
+        self.art_atlas_slots = 48  # Covers per atlas size before LRU slot reuse
+        
+        # Labels are truncated to pixel widths; fitted strings are memoized
+        self.text_fitter = TextFitter()
+        # Scratch surfaces of translucent overlays, reused instead of allocated per frame
+        self.surface_pool = SurfacePool()
         
         # Initialize fonts
         self._init_fonts()
@@ -125,6 +161,10 @@ class UIConfig:
         secs = int(seconds % 60)
         return f"{minutes:02d}:{secs:02d}"
 
+    def fit_text(self, font, text, max_width):
+        """Truncate text with "..." so it fits max_width pixels when rendered with font"""
+        return self.text_fitter.fit(font, text, max_width)
+
     def set_font(self, font_name):
         """Set the system font dynamically and update all font objects"""
         font_map = {
@@ -133,6 +173,7 @@ class UIConfig:
             "Source Sans 3": "source sans 3"
         }
         selected_font = font_map.get(font_name, "helvetica")
+        self.text_fitter.clear()  # Widths measured with the old fonts no longer apply
         try:
             available_fonts = pygame.font.get_fonts()
             if selected_font not in available_fonts:
@@ -229,10 +229,11 @@ class VideoPlayer:
         controls_y = self.config.DISPLAY_HEIGHT - controls_height
         
         # Semi-transparent background for controls
-        controls_surface = pygame.Surface((self.config.SCREEN_WIDTH, controls_height))
+        controls_surface = self.config.surface_pool.acquire((self.config.SCREEN_WIDTH, controls_height))
         controls_surface.set_alpha(200)
         controls_surface.fill((0, 0, 0))
         screen.blit(controls_surface, (0, controls_y))
+        self.config.surface_pool.release(controls_surface)
         
         # Get video duration and current position
         current_time = 0.0
@@ -106,22 +106,21 @@ class YouTubePlayer:
         
         # Create semi-transparent background for video info
         info_height = 70
-        info_surface = pygame.Surface((self.ui_config.SCREEN_WIDTH, info_height))
+        info_surface = self.ui_config.surface_pool.acquire((self.ui_config.SCREEN_WIDTH, info_height))
         info_surface.set_alpha(180)
         info_surface.fill((0, 0, 0))
         surface.blit(info_surface, (0, info_y))
+        self.ui_config.surface_pool.release(info_surface)
         
         # Video title - using font_now_playing_title and white text
-        title_text = self.current_video['title']
-        if len(title_text) > 35:
-            title_text = title_text[:35] + "..."
+        text_width = self.ui_config.SCREEN_WIDTH - 20
+        title_text = self.ui_config.fit_text(self.ui_config.font_now_playing_title, self.current_video['title'], text_width)
         title_surface = self.ui_config.font_now_playing_title.render(title_text, True, (255, 255, 255))
         surface.blit(title_surface, (10, info_y + 5))
         
         # Channel name - using font_now_playing_artist and light gray text
-        channel_text = f"Por: {self.current_video['uploader']}"
-        if len(channel_text) > 40:
-            channel_text = channel_text[:40] + "..."
+        channel_text = self.ui_config.fit_text(self.ui_config.font_now_playing_artist,
+                                               f"Por: {self.current_video['uploader']}", text_width)
         channel_surface = self.ui_config.font_now_playing_artist.render(channel_text, True, (200, 200, 200))
         surface.blit(channel_surface, (10, info_y + 25))
         